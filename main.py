@@ -6,6 +6,8 @@ import uvicorn
 from src import app
 from src.app import HOST, PORT
 
+LOOP = "asyncio"
+
 if os.name == "nt":
     asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
 else:
@@ -13,9 +15,18 @@ else:
         import uvloop
 
         asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        LOOP = "uvloop"
 
     except ImportError:
         pass
 
 if __name__ == "__main__":
-    uvicorn.run("src:app", host=HOST, port=int(PORT), reload=True)
+    uvicorn.run(
+        "src:app",
+        host=HOST,
+        port=int(PORT),
+        reload=True,
+        loop=LOOP,
+        http="auto",
+        access_log=False,
+    )
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import contextlib
 import os
+import queue
 import asyncpg
 import logging
-import json
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
-from src.utils import UserHandler  # type: ignore  # noqa
+from src.utils import TokenHandler, UserHandler  # type: ignore  # noqa
+from src.utils.db import Connection, create_pool, prepare_hot_statements
+from src.utils.geocoder import geocoder
+from src.utils.log import filehandler
+from src.utils.visionboard_handler import VisionBoardHandler
 
 logger = logging.getLogger(__name__)
 
@@ -18,63 +27,229 @@ user_handler = UserHandler()
 
 HOST = os.environ["HOST"]
 PORT = os.environ["PORT"]
+PG_POOL_MIN = int(os.getenv("PG_POOL_MIN", "10"))
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "50"))
+# Set to 0 when connecting through PgBouncer in transaction mode
+PG_STATEMENT_CACHE_SIZE = int(os.getenv("PG_STATEMENT_CACHE_SIZE", "1024"))
+# Seconds a request may wait for a free connection before failing with 503
+PG_ACQUIRE_TIMEOUT = float(os.getenv("PG_ACQUIRE_TIMEOUT", "5"))
+LOG_BODIES = os.getenv("LOG_REQUEST_BODIES") == "1"
+MAX_LOGGED_BODY = 64 * 1024
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI request logger; avoids BaseHTTPMiddleware's response buffering."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
 
+        method = scope["method"]
+        path = scope["path"]
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         # Log request details
-        logger.info(f"📥 {request.method} {request.url.path}")
-        
-        # For POST requests to /posts, log the raw body
-        if request.method == "POST" and request.url.path == "/posts":
-            try:
-                body = await request.body()
-                logger.info(f"📄 Raw request body: {body.decode('utf-8')}")
-                
-                # Try to parse as JSON for better logging
-                try:
-                    json_body = json.loads(body.decode('utf-8'))
-                    logger.info(f"📄 Parsed JSON body: {json.dumps(json_body, indent=2)}")
-                except json.JSONDecodeError:
-                    logger.warning("📄 Request body is not valid JSON")
-                    
-            except Exception as e:
-                logger.error(f"❌ Error reading request body: {e}")
-        
-        response = await call_next(request)
-        
-        # Log response status
-        logger.info(f"📤 Response status: {response.status_code}")
-        
-        return response
+        logger.info("📥 %s %s", method, path)
+
+        # Opt-in: log the raw body of POST /posts as it streams through
+        if (
+            LOG_BODIES
+            and method == "POST"
+            and path == "/posts"
+            and logger.isEnabledFor(logging.DEBUG)
+        ):
+            body = bytearray()
+            downstream_receive = receive
+
+            truncated = False
+
+            async def receive():
+                nonlocal truncated
+                message = await downstream_receive()
+                if message["type"] == "http.request":
+                    chunk = message.get("body", b"")
+                    room = MAX_LOGGED_BODY - len(body)
+                    if len(chunk) > room:
+                        truncated = True
+                    body.extend(chunk[:room])
+                    if not message.get("more_body", False):
+                        if truncated:
+                            logger.debug("📄 Request body: %s <truncated>", bytes(body))
+                        else:
+                            logger.debug("📄 Request body: %s", bytes(body))
+                            try:
+                                orjson.loads(body)
+                            except orjson.JSONDecodeError:
+                                logger.warning("📄 Request body is not valid JSON")
+                return message
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # Log response status
+                logger.info("📤 Response status: %s", message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class BearerTokenMiddleware:
+    """
+    Decodes the bearer token once per request and stores it on
+    request.state.token for the get_user_token dependencies to pick up.
+    Invalid or missing tokens are left for those dependencies to reject.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            token_handler = scope["app"].state.token_handler
+            if token_handler is not None:
+                for name, value in scope["headers"]:
+                    if name == b"authorization":
+                        scheme, _, credentials = value.decode("latin-1").partition(" ")
+                        if scheme.lower() == "bearer" and credentials:
+                            try:
+                                token = token_handler.decode_token(credentials)
+                            except Exception:
+                                token = None
+                            if token is not None:
+                                scope.setdefault("state", {})["token"] = token
+                        break
+
+        await self.app(scope, receive, send)
+
+
+def start_log_listeners() -> list[QueueListener]:
+    """Move blocking log handlers onto QueueListener threads."""
+    listeners = []
+
+    root_handlers = [h for h in logging.root.handlers if not isinstance(h, QueueHandler)]
+    if root_handlers:
+        root_queue = queue.Queue(-1)
+        logging.root.handlers = [QueueHandler(root_queue)]
+        listeners.append(
+            QueueListener(root_queue, *root_handlers, respect_handler_level=True)
+        )
+
+    # CustomLogger attaches the rotating file handler to its own logger, so
+    # it gets a separate queue to avoid double delivery through the root.
+    file_queue = queue.Queue(-1)
+    file_queue_handler = QueueHandler(file_queue)
+    for named in list(logging.root.manager.loggerDict.values()):
+        if isinstance(named, logging.Logger) and filehandler in named.handlers:
+            named.removeHandler(filehandler)
+            named.addHandler(file_queue_handler)
+    listeners.append(
+        QueueListener(file_queue, filehandler, respect_handler_level=True)
+    )
+
+    for listener in listeners:
+        listener.start()
+    return listeners
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    if PG_STATEMENT_CACHE_SIZE:
+        await prepare_hot_statements(conn)
 
 
 async def startup():
+    app.state.log_listeners = start_log_listeners()
     await user_handler.init()
 
     # Initialize PostgreSQL connection pool
-    app.state.pool = await asyncpg.create_pool(
+    app.state.pool = await create_pool(
         os.environ["DATABASE_URL"],
-        min_size=1,
-        max_size=10
+        acquire_timeout=PG_ACQUIRE_TIMEOUT,
+        min_size=PG_POOL_MIN,
+        max_size=PG_POOL_MAX,
+        max_inactive_connection_lifetime=300,
+        max_queries=50000,
+        statement_cache_size=PG_STATEMENT_CACHE_SIZE,
+        command_timeout=30,
+        # Startup parameters survive the pool's RESET ALL on release, unlike a
+        # session SET. Queries are short OLTP lookups; JIT only adds planning cost
+        server_settings={"jit": "off", "application_name": "creatist"},
+        init=init_connection,
+        connection_class=Connection,
     )
-    app.state.jwt_secret = os.environ["JWT_SECRET"]
+    user_handler.pool = app.state.pool
+    app.state.visionboard_handler = VisionBoardHandler(app.state.pool)
+    # The one handler every router and websocket reads, so they share its
+    # decoded-token cache
+    app.state.token_handler = TokenHandler(os.environ["JWT_SECRET"])
 
 
 async def shutdown():
-    if hasattr(app.state, 'pool'):
-        await app.state.pool.close()
+    pool = app.state.pool
+    if pool is not None:
+        await pool.close()
+
+    await geocoder.close()
+
+    for listener in app.state.log_listeners:
+        listener.stop()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The pool and the handlers built on it live for the whole process
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
+app = FastAPI(
+    title="Creatist API Documentation",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    # Routes let unexpected errors propagate instead of wrapping each in a
+    # 500; Starlette re-raises afterwards so the server still logs the trace
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
+
+@app.exception_handler(TimeoutError)
+async def database_timeout_handler(request: Request, exc: TimeoutError):
+    # Raised when the pool has no free connection in time (or a query times out)
+    logger.warning("⏳ Database timeout on %s %s", request.method, request.url.path)
+    return ORJSONResponse({"detail": "Service temporarily unavailable"}, status_code=503)
 
 
-app = FastAPI(title="Creatist API Documentation", on_startup=[startup], on_shutdown=[shutdown])
+app.state.pool = None
+app.state.token_handler = None
+app.state.visionboard_handler = None
+app.state.log_listeners = []
 
 # Add request logging middleware
 app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(BearerTokenMiddleware)
+# Compress large JSON payloads (post feeds, vision board details)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-from .routes import *  # noqa
-from .routes.ws_chat import router as ws_router
-from .routes.post import router as post_router
+from .routes.auth import router as auth_router  # noqa: E402
+from .routes.root import router as root_router  # noqa: E402
+from .routes.user import router as user_router  # noqa: E402
+from .routes.otp import router as otp_router  # noqa: E402
+from .routes.visionboard import router as visionboard_router  # noqa: E402
+from .routes.ws_chat import router as ws_router  # noqa: E402
+from .routes.post import router as post_router  # noqa: E402
 
+app.include_router(auth_router)
+app.include_router(root_router)
+app.include_router(user_router)
+app.include_router(otp_router)
+app.include_router(visionboard_router)
 # Include WebSocket router
 app.include_router(ws_router)
 # Include Post router
@@ -1,11 +1,11 @@
 from enum import Enum
 
-class MediaType(Enum):
+class MediaType(str, Enum):
     IMAGE = "image"
     VIDEO = "video"
 
 
-class UserGenre(Enum):
+class UserGenre(str, Enum):
     VIDEOGRAPHER = "videographer"
     PHOTOGRAPHER = "photographer"
     VOCALIST = "vocalist"
@@ -26,12 +26,12 @@ class UserGenre(Enum):
     PERCUSSIONIST = "percussionist"
 
 
-class PaymentMode(Enum):
+class PaymentMode(str, Enum):
     FREE = "free"
     PAID = "paid"
 
 
-class WorkMode(Enum):
+class WorkMode(str, Enum):
     ONLINE = "Online"
     ONSITE = "Onsite"
     ONLINE_ONSITE = "OnsiteOnline"
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Annotated, Any, Optional
+
+import orjson
+from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
+
+
+def _to_json_bytes(value: Any) -> Any:
+    if value is None or isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        # jsonb columns come back from asyncpg as text; keep it unparsed
+        return value.encode()
+    return orjson.dumps(value)
+
+
+def _object_to_json_bytes(value: Any) -> Any:
+    # Client input: a str is only accepted if it holds a JSON object, so bad
+    # payloads are a 422 here rather than an invalid-json error in Postgres
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes)):
+        try:
+            value = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            raise ValueError("value is not valid JSON") from None
+    if not isinstance(value, dict):
+        raise ValueError("value must be a JSON object")
+    return orjson.dumps(value)
+
+
+def parse_json_bytes(value: Optional[bytes]) -> Any:
+    return orjson.loads(value) if value else None
+
+
+def json_text(value: Any) -> Optional[str]:
+    """
+    Returns `value` as JSON text suitable for binding to a jsonb parameter.
+    Bytes are taken as already-serialized JSON; only None is stored as NULL,
+    so an empty object is stored as '{}'.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode()
+    return orjson.dumps(value).decode()
+
+
+# JSON document kept as serialized bytes; parsed only when dumped. Trusts str
+# input as JSON text, so it is meant for models built from database rows.
+JSONBytes = Annotated[
+    bytes,
+    BeforeValidator(_to_json_bytes),
+    PlainSerializer(parse_json_bytes, return_type=Any),
+    WithJsonSchema({"type": "object"}),
+]
+
+# Request-side JSONBytes: the value must be a JSON object.
+JSONObjectBytes = Annotated[
+    bytes,
+    BeforeValidator(_object_to_json_bytes),
+    PlainSerializer(parse_json_bytes, return_type=Any),
+    WithJsonSchema({"type": "object"}),
+]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+
+@lru_cache(maxsize=None)
+def optional(
+    model: Type[BaseModel], name: str, exclude: Tuple[str, ...] = ()
+) -> Type[BaseModel]:
+    """
+    Builds a partial-update model from `model` with every field Optional and
+    defaulting to None. Validators are not carried over.
+    """
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in model.model_fields.items()
+        if field_name not in exclude
+    }
+    return create_model(name, __module__=model.__module__, **fields)
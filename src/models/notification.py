@@ -1,9 +1,13 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Any
 from uuid import UUID
 from datetime import datetime
 
+from .fields import JSONBytes, parse_json_bytes
+
 class Notification(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_default=False)
+
     id: UUID
     receiver_id: UUID
     sender_id: UUID
@@ -11,7 +15,11 @@ class Notification(BaseModel):
     object_id: UUID   # the id of the referenced object
     event_type: str   # e.g., 'created', 'invitation', 'like', 'message', 'comment'
     status: str
-    data: Optional[Dict[str, Any]] = None  # extra context (optional)
+    data: Optional[JSONBytes] = None  # extra context (optional)
     message: Optional[str]
     created_at: datetime
-    updated_at: datetime 
\ No newline at end of file
+    updated_at: datetime
+
+    @property
+    def data_parsed(self) -> Optional[Any]:
+        return parse_json_bytes(self.data)
@@ -2,7 +2,7 @@ from __future__ import annotations
 import uuid
 import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 class PostStatus(str, Enum):
@@ -57,7 +57,7 @@ class PostComment(BaseModel):
     user_id: uuid.UUID
     content: str
     parent_comment_id: Optional[uuid.UUID] = None
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     deleted_at: Optional[datetime.datetime] = None
 
 class PostCommentCreate(BaseModel):
@@ -70,13 +70,13 @@ class PostCommentUpdate(BaseModel):
 class PostLike(BaseModel):
     user_id: uuid.UUID
     post_id: uuid.UUID
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class PostView(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     post_id: uuid.UUID
     user_id: Optional[uuid.UUID] = None
-    viewed_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    viewed_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class Hashtag(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
@@ -87,6 +87,8 @@ class PostHashtag(BaseModel):
     hashtag_id: uuid.UUID
 
 class Post(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_default=False)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     user_id: uuid.UUID
     caption: Optional[str] = None
@@ -94,8 +96,8 @@ class Post(BaseModel):
     status: PostStatus = PostStatus.public
     visibility: PostVisibility = PostVisibility.public
     shared_from_post_id: Optional[uuid.UUID] = None
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     deleted_at: Optional[datetime.datetime] = None
 
 class PostCreate(BaseModel):
@@ -58,6 +58,10 @@ class Showcase(BaseModel):
     description: Optional[str] = None
     media_link: Optional[str] = None
     media_type: Optional[str] = None
+    # Computed per viewer, not stored in DB
+    is_liked: Optional[bool] = None
+    is_bookmarked: Optional[bool] = None
+    comment_count: Optional[int] = None
 
 
 class ShowCaseLike(BaseModel):
@@ -3,48 +3,51 @@ import datetime
 import uuid
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from enum import Enum
 
+from .fields import JSONBytes, JSONObjectBytes, parse_json_bytes
+from .helpers import optional
+
 # Enums
-class VisionBoardStatus(Enum):
+class VisionBoardStatus(str, Enum):
     DRAFT = "Draft"
     ACTIVE = "Active"
     COMPLETED = "Completed"
     CANCELLED = "Cancelled"
 
-class AssignmentStatus(Enum):
+class AssignmentStatus(str, Enum):
     PENDING = "Pending"
     ACCEPTED = "Accepted"
     REJECTED = "Rejected"
     REMOVED = "Removed"
 
-class WorkType(Enum):
+class WorkType(str, Enum):
     ONLINE = "Online"
     OFFLINE = "Offline"
 
-class PaymentType(Enum):
+class PaymentType(str, Enum):
     PAID = "Paid"
     UNPAID = "Unpaid"
 
-class TaskPriority(Enum):
+class TaskPriority(str, Enum):
     LOW = "Low"
     MEDIUM = "Medium"
     HIGH = "High"
     CRITICAL = "Critical"
 
-class TaskStatus(Enum):
+class TaskStatus(str, Enum):
     NOT_STARTED = "Not Started"
     IN_PROGRESS = "In Progress"
     COMPLETED = "Completed"
     BLOCKED = "Blocked"
 
-class EquipmentStatus(Enum):
+class EquipmentStatus(str, Enum):
     REQUIRED = "Required"
     CONFIRMED = "Confirmed"
     NOT_AVAILABLE = "Not Available"
 
-class DependencyType(Enum):
+class DependencyType(str, Enum):
     FINISH_TO_START = "Finish-to-Start"
     START_TO_START = "Start-to-Start"
     FINISH_TO_FINISH = "Finish-to-Finish"
@@ -63,13 +66,14 @@ class VisionBoard(BaseModel):
     start_date: datetime.datetime
     end_date: datetime.datetime
     status: VisionBoardStatus = VisionBoardStatus.DRAFT
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     created_by: uuid.UUID
 
-    @validator('end_date')
-    def end_date_after_start_date(cls, v, values):
-        if 'start_date' in values and v <= values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info: ValidationInfo):
+        if 'start_date' in info.data and v <= info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
 
@@ -80,18 +84,14 @@ class VisionBoardCreate(BaseModel):
     end_date: datetime.datetime
     status: VisionBoardStatus = VisionBoardStatus.DRAFT
 
-    @validator('end_date')
-    def end_date_after_start_date(cls, v, values):
-        if 'start_date' in values and v <= values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info: ValidationInfo):
+        if 'start_date' in info.data and v <= info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
 
-class VisionBoardUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    start_date: Optional[datetime.datetime] = None
-    end_date: Optional[datetime.datetime] = None
-    status: Optional[VisionBoardStatus] = None
+VisionBoardUpdate = optional(VisionBoardCreate, "VisionBoardUpdate")
 
 class Genre(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
@@ -100,7 +100,7 @@ class Genre(BaseModel):
     description: Optional[str] = None
     min_required_people: int = 1
     max_allowed_people: Optional[int] = None
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class GenreCreate(BaseModel):
     name: str
@@ -108,11 +108,7 @@ class GenreCreate(BaseModel):
     min_required_people: int = 1
     max_allowed_people: Optional[int] = None
 
-class GenreUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    min_required_people: Optional[int] = None
-    max_allowed_people: Optional[int] = None
+GenreUpdate = optional(GenreCreate, "GenreUpdate")
 
 class Equipment(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
@@ -121,7 +117,11 @@ class Equipment(BaseModel):
     category: str  # e.g., 'Camera', 'Lighting', 'Audio'
     brand: Optional[str] = None
     model: Optional[str] = None
-    specifications: Optional[Dict[str, Any]] = None
+    specifications: Optional[JSONBytes] = None
+
+    @property
+    def specifications_parsed(self) -> Optional[Dict[str, Any]]:
+        return parse_json_bytes(self.specifications)
 
 class EquipmentCreate(BaseModel):
     name: str
@@ -129,15 +129,9 @@ class EquipmentCreate(BaseModel):
     category: str
     brand: Optional[str] = None
     model: Optional[str] = None
-    specifications: Optional[Dict[str, Any]] = None
+    specifications: Optional[JSONObjectBytes] = None
 
-class EquipmentUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    category: Optional[str] = None
-    brand: Optional[str] = None
-    model: Optional[str] = None
-    specifications: Optional[Dict[str, Any]] = None
+EquipmentUpdate = optional(EquipmentCreate, "EquipmentUpdate")
 
 class GenreAssignment(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
@@ -148,13 +142,14 @@ class GenreAssignment(BaseModel):
     payment_type: PaymentType
     payment_amount: Optional[Decimal] = None
     currency: Optional[str] = None
-    invited_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    invited_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     responded_at: Optional[datetime.datetime] = None
     assigned_by: uuid.UUID
 
-    @validator('payment_amount')
-    def validate_payment_amount(cls, v, values):
-        if values.get('payment_type') == PaymentType.PAID and v is None:
+    @field_validator('payment_amount')
+    @classmethod
+    def validate_payment_amount(cls, v, info: ValidationInfo):
+        if info.data.get('payment_type') == PaymentType.PAID and v is None:
             raise ValueError('Payment amount is required when payment type is Paid')
         return v
 
@@ -204,8 +199,8 @@ class VisionBoardTask(BaseModel):
     due_date: Optional[datetime.datetime] = None
     estimated_hours: Optional[Decimal] = None
     actual_hours: Optional[Decimal] = None
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
     created_by: uuid.UUID
 
 class VisionBoardTaskCreate(BaseModel):
@@ -240,8 +235,8 @@ class TaskComment(BaseModel):
     task_id: uuid.UUID
     user_id: uuid.UUID
     comment: str
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class TaskCommentCreate(BaseModel):
     comment: str
@@ -257,7 +252,7 @@ class TaskAttachment(BaseModel):
     file_type: Optional[str] = None
     file_size: Optional[int] = None
     uploaded_by: uuid.UUID
-    uploaded_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    uploaded_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class TaskAttachmentCreate(BaseModel):
     file_name: str
@@ -286,6 +281,8 @@ class VisionBoardTaskWithDetails(VisionBoardTask):
     genre_name: Optional[str] = None
 
 class VisionBoardSummary(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore', validate_default=False)
+
     id: uuid.UUID
     name: str
     status: VisionBoardStatus
@@ -299,6 +296,8 @@ class VisionBoardSummary(BaseModel):
 
 # Statistics Models
 class VisionBoardStats(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     total_visionboards: int
     active_visionboards: int
     completed_visionboards: int
@@ -315,15 +314,19 @@ class Invitation(BaseModel):
     object_type: str
     object_id: uuid.UUID
     status: InvitationStatus
-    data: dict | None = None
+    data: JSONBytes | None = None
     created_at: datetime.datetime
     responded_at: datetime.datetime | None = None
 
+    @property
+    def data_parsed(self) -> dict | None:
+        return parse_json_bytes(self.data)
+
 class InvitationCreate(BaseModel):
     receiver_id: uuid.UUID
     object_type: str
     object_id: uuid.UUID
-    data: dict | None = None
+    data: JSONObjectBytes | None = None
 
 class InvitationUpdate(BaseModel):
     status: InvitationStatus
@@ -358,8 +361,8 @@ class Draft(BaseModel):
     media_url: str
     media_type: Optional[str] = None  # e.g., 'image', 'video', 'audio'
     description: Optional[str] = None
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class DraftCreate(BaseModel):
     visionboard_id: uuid.UUID
@@ -367,18 +370,15 @@ class DraftCreate(BaseModel):
     media_type: Optional[str] = None
     description: Optional[str] = None
 
-class DraftUpdate(BaseModel):
-    media_url: Optional[str] = None
-    media_type: Optional[str] = None
-    description: Optional[str] = None
+DraftUpdate = optional(DraftCreate, "DraftUpdate", exclude=("visionboard_id",))
 
 class DraftComment(BaseModel):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     draft_id: uuid.UUID
     user_id: uuid.UUID
     comment: str
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
+    created_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
+    updated_at: datetime.datetime = Field(default_factory=lambda: datetime.datetime.now(datetime.UTC))
 
 class DraftCommentCreate(BaseModel):
     draft_id: uuid.UUID
@@ -1,6 +0,0 @@
-from .auth import *  # noqa
-from .root import *  # noqa
-from .user import *  # noqa
-from .otp import *  # noqa
-from .visionboard import *  # noqa
-from .ws_chat import *  # noqa
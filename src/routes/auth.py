@@ -1,110 +1,121 @@
 from __future__ import annotations
 
-import os
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, field_validator
 
-from src.app import app, user_handler
+from src.app import user_handler
 from src.models import User
-from src.utils import Token, TokenHandler
+from src.utils import Token
+from src.utils.routing import ORJSONRoute
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
-JWT_SECRET = os.environ["JWT_SECRET"]
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=ORJSONRoute)
 
 
 class Credential(BaseModel):
-    email: EmailStr
+    email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, v: str) -> str:
+        # Cheap shape check; the lookup itself rejects unknown addresses
+        local, sep, domain = v.rpartition("@")
+        if not (local and sep and "." in domain):
+            raise ValueError("value is not a valid email address")
+        return f"{local}@{domain.lower()}"
+
 
 class RefreshRequest(BaseModel):
     refresh_token: str
 
 
-token_handler = TokenHandler(os.environ["JWT_SECRET"])
 security = HTTPBearer()
+CredDep = Annotated[HTTPAuthorizationCredentials, Depends(security)]
+
+
+async def get_user_token(request: Request, credentials: CredDep) -> Token:
+    # Sub-dependencies may resolve this more than once per request
+    token = getattr(request.state, "token", None)
+    if token is None:
+        token = request.app.state.token_handler.decode_token(credentials.credentials)
+        request.state.token = token
+    return token
 
 
-def get_user_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    return token_handler.decode_token(credentials.credentials)
+TokenDep = Annotated[Token, Depends(get_user_token)]
 
 
 @router.post("/signin")
-async def signin_route(request: Request, credential: Credential) -> JSONResponse:
+async def signin_route(request: Request, credential: Credential) -> dict:
     user = await user_handler.fetch_user(
         email=credential.email, password=credential.password
     )
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    access_token, refresh_token = token_handler.create_token_pair(user)
+    access_token, refresh_token = request.app.state.token_handler.create_token_pair(user)
 
-    return JSONResponse({
+    return {
         "message": "success", 
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token_type": "bearer",
         "expires_in": 900  # 15 minutes
-    })
+    }
 
 
 @router.post("/signup")
-async def signup_route(request: Request, user: User) -> JSONResponse:
+async def signup_route(request: Request, user: User) -> dict:
     _user = await user_handler.fetch_user(email=user.email, password=user.password)
     if _user is not None:
         raise HTTPException(400, "User already exists")
 
     await user_handler.create_user(user=user)
 
-    return JSONResponse({"message": "success"})
+    return {"message": "success"}
 
 
 @router.get("/fetch")
-async def fetch_user_route(token: Token = Depends(get_user_token)) -> User:
+async def fetch_user_route(token: TokenDep) -> User:
     user = await user_handler.fetch_user(user_id=token.sub)
     return user
 
 
 @router.post("/refresh")
-async def refresh_route(request: Request, refresh_request: RefreshRequest) -> JSONResponse:
+async def refresh_route(request: Request, refresh_request: RefreshRequest) -> dict:
     """Refresh access token using refresh token"""
-    new_access_token = token_handler.refresh_access_token(refresh_request.refresh_token)
+    new_access_token = request.app.state.token_handler.refresh_access_token(refresh_request.refresh_token)
     
     if not new_access_token:
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
     
-    return JSONResponse({
+    return {
         "message": "success", 
         "access_token": new_access_token,
         "token_type": "bearer",
         "expires_in": 900  # 15 minutes
-    })
+    }
 
 
 @router.post("/logout")
-async def logout_route(request: Request, refresh_request: RefreshRequest) -> JSONResponse:
+async def logout_route(request: Request, refresh_request: RefreshRequest) -> dict:
     """Logout by revoking refresh token"""
-    success = token_handler.revoke_refresh_token(refresh_request.refresh_token)
+    success = request.app.state.token_handler.revoke_refresh_token(refresh_request.refresh_token)
     
     if not success:
         raise HTTPException(status_code=400, detail="Invalid refresh token")
     
-    return JSONResponse({"message": "success"})
+    return {"message": "success"}
 
 
 @router.post("/update")
-async def update_user_route(
-    user: User, token: Token = Depends(get_user_token)
-) -> User:
+async def update_user_route(user: User, token: TokenDep) -> User:
     updated_user = await user_handler.update_user(
         user_id=token.sub, update_payload=user
     )
     if updated_user is None:
         raise HTTPException(400, "Failed to update User")
     return updated_user
-
-
-app.include_router(router)
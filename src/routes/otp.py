@@ -1,24 +1,13 @@
 from __future__ import annotations
 
-import os
-from fastapi import APIRouter, Depends, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
 from typing import Optional
-from src.app import app
 from src.utils.email_handler import send_otp_mail
-from src.utils import TokenHandler, token_handler
+from src.utils.routing import ORJSONRoute
 import random
 
-router = APIRouter(prefix="/auth/otp", tags=["OTP Authentication"])
-JWT_SECRET = os.environ["JWT_SECRET"]
-token_handler = TokenHandler(JWT_SECRET)
-security = HTTPBearer()
-
-
-
-def get_user_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    return token_handler.decode_token(credentials.credentials)
+router = APIRouter(prefix="/auth/otp", tags=["OTP Authentication"], route_class=ORJSONRoute)
 
 
 class StatusUpdate(BaseModel):
@@ -70,6 +59,3 @@ async def verify_otp(
         return False
 
     return True
-
-
-app.include_router(router)
\ No newline at end of file
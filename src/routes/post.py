@@ -2,124 +2,128 @@ import logging
 import json
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from pydantic import TypeAdapter
+from typing import Any, Dict, List, Optional
 import uuid
 from src.models.post import (
     Post, PostCreate, PostUpdate, PostWithDetails, PostComment, PostCommentCreate, PostCommentUpdate
 )
 from src.utils.post_handler import PostHandler
 from src.utils import Token
-from src.routes.visionboard import get_user_token
+from src.utils.responses import encode_json, json_response
+from src.utils.routing import ORJSONRoute
+from src.routes.auth import get_user_token
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for every paginated posts endpoint
+MAX_PAGE_SIZE = 50
+
+# Routes keep response_model for the OpenAPI schema but return a Response
+# encoded by pydantic-core, which skips FastAPI's revalidation pass
+_PAGE_ADAPTER = TypeAdapter(Dict[str, Any])
+_POSTS_ADAPTER = TypeAdapter(List[PostWithDetails])
+_COMMENTS_ADAPTER = TypeAdapter(List[PostComment])
+
 def get_post_handler(request: Request) -> PostHandler:
     return PostHandler(request.app.state.pool)
 
-router = APIRouter(prefix="/posts", tags=["Posts"])
+router = APIRouter(prefix="/posts", tags=["Posts"], route_class=ORJSONRoute)
 
 @router.post("", response_model=dict)
 async def create_post(post: PostCreate, request: Request, token: Token = Depends(get_user_token)):
     """Create a new post with comprehensive debug logging"""
     logger.info("🚀 POST /posts - Create post request received")
-    logger.info(f"   User ID (from token): {token.sub}")
-    logger.info(f"   Post data received: {post.model_dump()}")
+    logger.info("   User ID (from token): %s", token.sub)
+    logger.info(
+        "   Post data received (media=%d, tags=%d, collaborators=%d)",
+        len(post.media), len(post.tags), len(post.collaborators),
+    )
     
     try:
-        # Log individual fields for debugging
-        logger.debug(f"   Caption: {post.caption}")
-        logger.debug(f"   Media count: {len(post.media) if post.media else 0}")
-        logger.debug(f"   Tags count: {len(post.tags) if post.tags else 0}")
-        logger.debug(f"   Collaborators count: {len(post.collaborators) if post.collaborators else 0}")
-        logger.debug(f"   Visionboard ID: {post.visionboard_id}")
-        logger.debug(f"   Visibility: {post.visibility}")
-        
-        # Log collaborators details if present
-        if post.collaborators:
-            logger.debug("   Collaborators details:")
-            for i, collab in enumerate(post.collaborators):
-                logger.debug(f"     {i+1}. User ID: {collab.user_id}, Role: {collab.role}")
-        
-        # Log media details if present
-        if post.media:
-            logger.debug("   Media details:")
-            for i, media in enumerate(post.media):
-                logger.debug(f"     {i+1}. URL: {media.url}, Type: {media.type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log individual fields for debugging
+            logger.debug("   Caption: %s", post.caption)
+            logger.debug("   Visionboard ID: %s", post.visionboard_id)
+            logger.debug("   Visibility: %s", post.visibility)
+            
+            # Log collaborators details if present
+            if post.collaborators:
+                logger.debug("   Collaborators details:")
+                for i, collab in enumerate(post.collaborators):
+                    logger.debug("     %d. User ID: %s, Role: %s", i + 1, collab.user_id, collab.role)
+            
+            # Log media details if present
+            if post.media:
+                logger.debug("   Media details:")
+                for i, media in enumerate(post.media):
+                    logger.debug("     %d. URL: %s, Type: %s", i + 1, media.url, media.type)
         
         handler = get_post_handler(request)
         logger.info("✅ Post data validation passed, creating post...")
         
         post_id = await handler.create_post(post, token.sub)
-        logger.info(f"✅ Post created successfully with ID: {post_id}")
+        logger.info("✅ Post created successfully with ID: %s", post_id)
         
         return {"post_id": str(post_id)}
         
     except Exception as e:
-        logger.error(f"❌ Error creating post: {str(e)}")
-        logger.error(f"   Error type: {type(e).__name__}")
-        logger.error(f"   Post data that caused error: {post.model_dump()}")
+        # PostHandler.create_post already logged the traceback and payload
+        logger.error("❌ Error creating post: %s: %s", type(e).__name__, e)
         raise HTTPException(status_code=500, detail=f"Failed to create post: {str(e)}")
 
 @router.get("/feed", response_model=dict)
-async def get_feed(request: Request, limit: int = 10, cursor: Optional[str] = None):
+async def get_feed(request: Request, limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     handler = get_post_handler(request)
-    return await handler.get_feed(limit=limit, cursor=cursor)
+    return json_response(encode_json(await handler.get_feed(limit=limit, cursor=cursor), _PAGE_ADAPTER))
 
-@router.get("/{post_id}", response_model=PostWithDetails)
-async def get_post(post_id: str, request: Request):
-    import uuid
-    from fastapi import HTTPException
-    try:
-        post_uuid = uuid.UUID(post_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid post_id format. Must be a valid UUID.")
+@router.get("/{post_id:uuid}", response_model=PostWithDetails)
+async def get_post(post_id: uuid.UUID, request: Request):
     handler = get_post_handler(request)
-    post = await handler.get_post_by_id(post_uuid)
+    post = await handler.get_post_by_id(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return json_response(encode_json(post))
 
-@router.post("/{post_id}/like")
-async def like_post(post_id: str, request: Request, token: Token = Depends(get_user_token)):
+@router.post("/{post_id:uuid}/like")
+async def like_post(post_id: uuid.UUID, request: Request, token: Token = Depends(get_user_token)):
     handler = get_post_handler(request)
-    await handler.like_post(uuid.UUID(post_id), token.sub)
+    await handler.like_post(post_id, token.sub)
     return {"message": "Liked"}
 
-@router.delete("/{post_id}/like")
-async def unlike_post(post_id: str, request: Request, token: Token = Depends(get_user_token)):
+@router.delete("/{post_id:uuid}/like")
+async def unlike_post(post_id: uuid.UUID, request: Request, token: Token = Depends(get_user_token)):
     handler = get_post_handler(request)
-    await handler.unlike_post(uuid.UUID(post_id), token.sub)
+    await handler.unlike_post(post_id, token.sub)
     return {"message": "Unliked"}
 
-@router.post("/{post_id}/comments", response_model=PostComment)
-async def add_comment(post_id: str, comment: PostCommentCreate, request: Request, token: Token = Depends(get_user_token)):
+@router.post("/{post_id:uuid}/comments", response_model=PostComment)
+async def add_comment(post_id: uuid.UUID, comment: PostCommentCreate, request: Request, token: Token = Depends(get_user_token)):
     handler = get_post_handler(request)
-    return await handler.add_comment(uuid.UUID(post_id), token.sub, comment)
+    return json_response(encode_json(await handler.add_comment(post_id, token.sub, comment)))
 
-@router.get("/{post_id}/comments", response_model=List[PostComment])
-async def get_comments(post_id: str, request: Request, parent_id: Optional[str] = None, limit: int = 10, cursor: Optional[str] = None):
+@router.get("/{post_id:uuid}/comments", response_model=List[PostComment])
+async def get_comments(post_id: uuid.UUID, request: Request, parent_id: Optional[uuid.UUID] = None, limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     handler = get_post_handler(request)
-    parent_uuid = uuid.UUID(parent_id) if parent_id else None
-    return await handler.get_comments(uuid.UUID(post_id), parent_uuid, limit, cursor)
+    return json_response(encode_json(await handler.get_comments(post_id, parent_id, limit, cursor), _COMMENTS_ADAPTER))
 
-@router.get("/user/{user_id}", response_model=List[PostWithDetails])
-async def get_user_posts(user_id: str, request: Request, limit: int = 10, cursor: Optional[str] = None):
+@router.get("/user/{user_id:uuid}", response_model=List[PostWithDetails])
+async def get_user_posts(user_id: uuid.UUID, request: Request, limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     handler = get_post_handler(request)
-    return await handler.get_user_posts(uuid.UUID(user_id), limit, cursor)
+    return json_response(encode_json(await handler.get_user_posts(user_id, limit, cursor), _POSTS_ADAPTER))
 
 @router.get("/search", response_model=List[PostWithDetails])
-async def search_posts(request: Request, q: str, tag: Optional[str] = None, limit: int = 10, cursor: Optional[str] = None):
+async def search_posts(request: Request, q: str, tag: Optional[str] = None, limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     handler = get_post_handler(request)
-    return await handler.search_posts(q, tag, limit, cursor)
+    return json_response(encode_json(await handler.search_posts(q, tag, limit, cursor), _POSTS_ADAPTER))
 
 @router.get("/trending", response_model=dict)
-async def get_trending_posts(request: Request, limit: int = 10, cursor: Optional[str] = None):
+async def get_trending_posts(request: Request, limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     handler = get_post_handler(request)
-    return await handler.get_trending_posts(limit, cursor)
+    return json_response(encode_json(await handler.get_trending_posts(limit, cursor), _PAGE_ADAPTER))
 
-@router.delete("/{post_id}")
-async def soft_delete_post(post_id: str, request: Request, token: Token = Depends(get_user_token)):
+@router.delete("/{post_id:uuid}")
+async def soft_delete_post(post_id: uuid.UUID, request: Request, token: Token = Depends(get_user_token)):
     handler = get_post_handler(request)
-    await handler.soft_delete_post(uuid.UUID(post_id), token.sub)
+    await handler.soft_delete_post(post_id, token.sub)
     return {"message": "Post soft deleted"} 
\ No newline at end of file
@@ -2,23 +2,22 @@ from __future__ import annotations
 
 from time import perf_counter
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request
 
-from src.app import app, user_handler
+from src.app import user_handler
 
+router = APIRouter(include_in_schema=False)
 
-@app.route("/")
-def root(request: Request) -> JSONResponse:
-    return JSONResponse(
-        {"message": "API for Creatist iOS Application"}, status_code=200
-    )
 
+@router.get("/")
+def root(request: Request) -> dict:
+    return {"message": "API for Creatist iOS Application"}
 
-@app.route("/ping")
-async def root(request: Request) -> JSONResponse:
+
+@router.get("/ping")
+async def ping(request: Request) -> dict:
     ini = perf_counter()
     _ = await user_handler.supabase.table("users").select("*").execute()
     fin = perf_counter() - ini
 
-    return JSONResponse({"message": "success", "response_time": fin})
+    return {"message": "success", "response_time": fin}
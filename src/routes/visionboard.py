@@ -1,21 +1,23 @@
 from __future__ import annotations
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-import decimal
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 import datetime
-from typing import List
+from typing import List, Optional
 import logging
+from cachetools import TTLCache
 
-from src.app import app
-from src.utils import Token, TokenHandler
-from src.utils.visionboard_handler import VisionBoardHandler
+from src.app import app, user_handler
+from src.routes.auth import get_user_token
+from src.utils import Token
+from src.utils.responses import encode_json, envelope, json_response
+from src.utils.routing import ORJSONRoute
 from src.models.visionboard import (
     VisionBoardCreate, VisionBoardUpdate, VisionBoardWithGenres,
     GenreCreate, GenreUpdate, GenreWithAssignments,
-    EquipmentCreate, EquipmentUpdate,
-    GenreAssignmentCreate, GenreAssignmentUpdate,
+    Equipment, EquipmentCreate, EquipmentUpdate,
+    GenreAssignmentCreate, GenreAssignmentUpdate, GenreAssignmentWithDetails,
     RequiredEquipmentCreate, RequiredEquipmentUpdate,
     VisionBoardTaskCreate, VisionBoardTaskUpdate, VisionBoardTaskWithDetails,
     TaskDependencyCreate,
@@ -23,47 +25,71 @@ from src.models.visionboard import (
     TaskAttachmentCreate,
     VisionBoardStatus, AssignmentStatus, TaskStatus,
     Invitation, InvitationCreate, InvitationUpdate, InvitationStatus,
-    GroupMessageCreate, Draft, DraftCreate, DraftUpdate, DraftComment, DraftCommentCreate, DraftCommentUpdate
+    GroupMessage, GroupMessageCreate, Draft, DraftCreate, DraftUpdate, DraftComment, DraftCommentCreate, DraftCommentUpdate
 )
 from src.models.notification import Notification
 from src.models.user import User
+from pydantic import TypeAdapter
 
-router = APIRouter(prefix="/v1/visionboard", tags=["Vision Board"])
-security = HTTPBearer()
-
-# Initialize handlers (lazy initialization)
-visionboard_handler = None
-token_handler = None
+router = APIRouter(prefix="/v1/visionboard", tags=["Vision Board"], default_response_class=ORJSONResponse, route_class=ORJSONRoute)
 
 logger = logging.getLogger(__name__)
+draft_logger = logging.getLogger("visionboard.draft")
 
 def get_visionboard_handler():
-    global visionboard_handler
-    if visionboard_handler is None:
-        visionboard_handler = VisionBoardHandler(app.state.pool)
-    return visionboard_handler
-
-def get_token_handler():
-    global token_handler
-    if token_handler is None:
-        token_handler = TokenHandler(app.state.jwt_secret)
-    return token_handler
-
-def get_user_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = get_token_handler().decode_token(credentials.credentials)
-    print('DEBUG: Decoded token:', token)
-    return token
-
-def to_serializable(obj):
-    if isinstance(obj, decimal.Decimal):
-        return float(obj)
-    if isinstance(obj, (datetime.datetime, datetime.date)):
-        return obj.isoformat()
-    if isinstance(obj, dict):
-        return {k: to_serializable(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [to_serializable(i) for i in obj]
-    return obj
+    # Built once in startup, shared with the websocket routes
+    return app.state.visionboard_handler
+
+async def _fetch_avatar_urls(sender_ids: List[str]) -> dict:
+    """sender id -> profile image url, looked up in a single query."""
+    try:
+        users = await user_handler.fetch_users_by_ids(sender_ids)
+    except Exception as e:
+        logger.error("   ❌ Failed to fetch avatars for %s senders: %s", len(sender_ids), e)
+        return {}
+    return {user_id: user.profile_image_url for user_id, user in users.items()}
+
+# Query/body status strings mapped to their enum members
+_VISIONBOARD_STATUSES = {s.value: s for s in VisionBoardStatus}
+_ASSIGNMENT_STATUSES = {s.value: s for s in AssignmentStatus}
+_TASK_STATUSES = {s.value: s for s in TaskStatus}
+_INVITATION_STATUSES = {s.value: s for s in InvitationStatus}
+
+# List endpoints splice pydantic-core's JSON into a pre-encoded envelope
+_EQUIPMENT_ADAPTER = TypeAdapter(List[Equipment])
+_ASSIGNMENTS_ADAPTER = TypeAdapter(List[GenreAssignmentWithDetails])
+_USERS_ADAPTER = TypeAdapter(List[User])
+_NOTIFICATIONS_ADAPTER = TypeAdapter(List[Notification])
+_INVITATIONS_ADAPTER = TypeAdapter(List[Invitation])
+_DRAFTS_ADAPTER = TypeAdapter(List[Draft])
+_DRAFT_COMMENTS_ADAPTER = TypeAdapter(List[DraftComment])
+_GROUP_MESSAGES_ADAPTER = TypeAdapter(List[GroupMessage])
+
+# Encoded bodies of read-mostly GETs, dropped by the writes that change them.
+# Per process, so the TTL bounds staleness across workers.
+EQUIPMENT_CACHE_TTL = 300
+VISIONBOARD_GENRES_CACHE_TTL = 30
+GENRE_ASSIGNMENTS_CACHE_TTL = 30
+EQUIPMENT_REQUIREMENTS_CACHE_TTL = 30
+_equipment_cache: TTLCache = TTLCache(maxsize=128, ttl=EQUIPMENT_CACHE_TTL)
+_visionboard_genres_cache: TTLCache = TTLCache(maxsize=512, ttl=VISIONBOARD_GENRES_CACHE_TTL)
+_genre_assignments_cache: TTLCache = TTLCache(maxsize=1024, ttl=GENRE_ASSIGNMENTS_CACHE_TTL)
+# No route writes required_equipment, so only the TTL and board deletion expire these
+_equipment_requirements_cache: TTLCache = TTLCache(maxsize=512, ttl=EQUIPMENT_REQUIREMENTS_CACHE_TTL)
+
+def status_query(statuses: dict, detail: str = "Invalid status", *, required: bool = False):
+    """
+    Dependency resolving the `status` query parameter to its enum member, so
+    unknown values get a 400 before the handler (and its 500 wrapper) runs.
+    """
+    async def parse(status: Optional[str] = Query(... if required else None)):
+        if not status and not required:
+            return None
+        member = statuses.get(status)
+        if member is None:
+            raise HTTPException(status_code=400, detail=detail)
+        return member
+    return parse
 
 # Vision Board CRUD Operations
 @router.post("/create")
@@ -78,253 +104,169 @@ async def create_visionboard(
             visionboard=visionboard, 
             created_by=token.sub
         )
-        return JSONResponse({
-            "message": "Vision board created successfully",
-            "visionboard": created_visionboard.model_dump(mode="json")
-        })
-    except Exception as e:
+        return json_response(envelope("visionboard", encode_json(created_visionboard), "Vision board created successfully"))
+    except (ValueError, asyncpg.PostgresError) as e:
+        # Rejected input: model validators or table constraints
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{visionboard_id}")
+@router.get("/{visionboard_id:uuid}")
 async def get_visionboard(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get a vision board by ID"""
-    try:
-        visionboard = await get_visionboard_handler().get_visionboard(uuid.UUID(visionboard_id))
-        if not visionboard:
-            raise HTTPException(status_code=404, detail="Vision board not found")
+    visionboard = await get_visionboard_handler().get_visionboard(visionboard_id)
+    if not visionboard:
+        raise HTTPException(status_code=404, detail="Vision board not found")
         
-        return JSONResponse({
-            "message": "success",
-            "visionboard": visionboard.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("visionboard", encode_json(visionboard)))
 
-@router.get("/{visionboard_id}/with-genres")
+@router.get("/{visionboard_id:uuid}/with-genres")
 async def get_visionboard_with_genres(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get a vision board with all its genres"""
-    try:
-        visionboard = await get_visionboard_handler().get_visionboard_with_genres(uuid.UUID(visionboard_id))
+    body = _visionboard_genres_cache.get(visionboard_id)
+    if body is None:
+        visionboard = await get_visionboard_handler().get_visionboard_with_genres(visionboard_id)
         if not visionboard:
             raise HTTPException(status_code=404, detail="Vision board not found")
-        
-        return JSONResponse({
-            "message": "success",
-            "visionboard": visionboard.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        body = envelope("visionboard", encode_json(visionboard))
+        _visionboard_genres_cache[visionboard_id] = body
+    return json_response(body)
 
-@router.put("/{visionboard_id}")
+@router.put("/{visionboard_id:uuid}")
 async def update_visionboard(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     updates: VisionBoardUpdate, 
     token: Token = Depends(get_user_token)
 ):
     """Update a vision board"""
-    try:
-        visionboard = await get_visionboard_handler().update_visionboard(
-            uuid.UUID(visionboard_id), 
-            updates
-        )
-        if not visionboard:
-            raise HTTPException(status_code=404, detail="Vision board not found")
+    visionboard = await get_visionboard_handler().update_visionboard(
+        visionboard_id, 
+        updates
+    )
+    if not visionboard:
+        raise HTTPException(status_code=404, detail="Vision board not found")
+    _visionboard_genres_cache.pop(visionboard_id, None)
         
-        return JSONResponse({
-            "message": "Vision board updated successfully",
-            "visionboard": visionboard.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("visionboard", encode_json(visionboard), "Vision board updated successfully"))
 
-@router.patch("/{visionboard_id}")
+@router.patch("/{visionboard_id:uuid}")
 async def patch_visionboard(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     updates: VisionBoardUpdate, 
     token: Token = Depends(get_user_token)
 ):
     """Patch a vision board (partial update)"""
-    try:
-        visionboard = await get_visionboard_handler().update_visionboard(
-            uuid.UUID(visionboard_id), 
-            updates
-        )
-        if not visionboard:
-            raise HTTPException(status_code=404, detail="Vision board not found")
-        return JSONResponse({
-            "message": "Vision board updated successfully",
-            "visionboard": visionboard.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    visionboard = await get_visionboard_handler().update_visionboard(
+        visionboard_id, 
+        updates
+    )
+    if not visionboard:
+        raise HTTPException(status_code=404, detail="Vision board not found")
+    _visionboard_genres_cache.pop(visionboard_id, None)
+    return json_response(envelope("visionboard", encode_json(visionboard), "Vision board updated successfully"))
 
-@router.delete("/{visionboard_id}")
+@router.delete("/{visionboard_id:uuid}")
 async def delete_visionboard(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Delete a vision board"""
-    try:
-        success = await get_visionboard_handler().delete_visionboard(uuid.UUID(visionboard_id))
-        if not success:
-            raise HTTPException(status_code=404, detail="Vision board not found")
+    success = await get_visionboard_handler().delete_visionboard(visionboard_id)
+    _visionboard_genres_cache.pop(visionboard_id, None)
+    _equipment_requirements_cache.pop(visionboard_id, None)
+    if not success:
+        raise HTTPException(status_code=404, detail="Vision board not found")
         
-        return JSONResponse({"message": "Vision board deleted successfully"})
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse({"message": "Vision board deleted successfully"})
 
 @router.get("/user/visionboards")
 async def get_user_visionboards(
     request: Request, 
-    status: str = None,
+    visionboard_status: Optional[VisionBoardStatus] = Depends(status_query(_VISIONBOARD_STATUSES)),
     token: Token = Depends(get_user_token)
 ):
     """Get all vision boards created by the current user"""
-    try:
-        visionboard_status = None
-        if status:
-            try:
-                visionboard_status = VisionBoardStatus(status)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid status")
-        
-        visionboards = await get_visionboard_handler().get_user_visionboards(
-            user_id=token.sub, 
-            status=visionboard_status
-        )
+    visionboards = await get_visionboard_handler().get_user_visionboards(
+        user_id=token.sub, 
+        status=visionboard_status,
+        serialize=True
+    )
         
-        return JSONResponse({
-            "message": "success",
-            "visionboards": [vb.model_dump(mode="json") for vb in visionboards]
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("visionboards", encode_json(visionboards)))
 
 @router.get("")
 async def get_visionboards_by_query(
     request: Request,
-    created_by: str = None,
-    partner_id: str = None,
-    status: str = None,
+    created_by: Optional[uuid.UUID] = None,
+    partner_id: Optional[uuid.UUID] = None,
+    visionboard_status: Optional[VisionBoardStatus] = Depends(status_query(_VISIONBOARD_STATUSES)),
     token: Token = Depends(get_user_token)
 ):
     """Get vision boards by query parameters"""
-    try:
-        visionboard_status = None
-        if status:
-            try:
-                visionboard_status = VisionBoardStatus(status)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid status")
-        
-        if created_by:
-            # Get vision boards created by a specific user
-            try:
-                user_uuid = uuid.UUID(created_by)
-                visionboards = await get_visionboard_handler().get_user_visionboards(
-                    user_id=user_uuid,
-                    status=visionboard_status
-                )
-                return JSONResponse({
-                    "message": "success",
-                    "visionboards": [vb.model_dump(mode="json") for vb in visionboards]
-                })
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid user ID")
-        
-        elif partner_id:
-            # Get vision boards where user is assigned/partner
-            try:
-                user_uuid = uuid.UUID(partner_id)
-                visionboards = await get_visionboard_handler().get_user_assigned_visionboards(
-                    user_id=user_uuid,
-                    status=visionboard_status
-                )
-                return JSONResponse({
-                    "message": "success",
-                    "visionboards": [vb.model_dump(mode="json") for vb in visionboards]
-                })
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid user ID")
-        
-        else:
-            # Default: get current user's vision boards
-            visionboards = await get_visionboard_handler().get_user_visionboards(
-                user_id=token.sub,
-                status=visionboard_status
-            )
-            return JSONResponse({
-                "message": "success",
-                "visionboards": [vb.model_dump(mode="json") for vb in visionboards]
-            })
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    handler = get_visionboard_handler()
+    if created_by:
+        # Get vision boards created by a specific user
+        visionboards = await handler.get_user_visionboards(
+            user_id=created_by,
+            status=visionboard_status,
+            serialize=True
+        )
+    elif partner_id:
+        # Get vision boards where user is assigned/partner
+        visionboards = await handler.get_user_assigned_visionboards(
+            user_id=partner_id,
+            status=visionboard_status,
+            serialize=True
+        )
+    else:
+        # Default: get current user's vision boards
+        visionboards = await handler.get_user_visionboards(
+            user_id=token.sub,
+            status=visionboard_status,
+            serialize=True
+        )
+    return json_response(envelope("visionboards", encode_json(visionboards)))
 
 # Genre Operations
-@router.post("/{visionboard_id}/genres")
+@router.post("/{visionboard_id:uuid}/genres")
 async def create_genre(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     genre: GenreCreate, 
     token: Token = Depends(get_user_token)
 ):
     """Create a new genre for a vision board"""
-    try:
-        created_genre = await get_visionboard_handler().create_genre(
-            visionboard_id=uuid.UUID(visionboard_id), 
-            genre=genre
-        )
-        return JSONResponse({
-            "message": "Genre created successfully",
-            "genre": created_genre.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    created_genre = await get_visionboard_handler().create_genre(
+        visionboard_id=visionboard_id, 
+        genre=genre
+    )
+    _visionboard_genres_cache.pop(visionboard_id, None)
+    return json_response(envelope("genre", encode_json(created_genre), "Genre created successfully"))
 
-@router.get("/genres/{genre_id}/with-assignments")
+@router.get("/genres/{genre_id:uuid}/with-assignments")
 async def get_genre_with_assignments(
     request: Request, 
-    genre_id: str, 
+    genre_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get a genre with all its assignments"""
-    try:
-        genre = await get_visionboard_handler().get_genre_with_assignments(uuid.UUID(genre_id))
+    body = _genre_assignments_cache.get(genre_id)
+    if body is None:
+        genre = await get_visionboard_handler().get_genre_with_assignments(genre_id)
         if not genre:
             raise HTTPException(status_code=404, detail="Genre not found")
-        
-        return JSONResponse({
-            "message": "success",
-            "genre": genre.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid genre ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        body = envelope("genre", encode_json(genre))
+        _genre_assignments_cache[genre_id] = body
+    return json_response(body)
 
 # Equipment Operations
 @router.post("/equipment")
@@ -334,14 +276,9 @@ async def create_equipment(
     token: Token = Depends(get_user_token)
 ):
     """Create new equipment"""
-    try:
-        created_equipment = await get_visionboard_handler().create_equipment(equipment)
-        return JSONResponse({
-            "message": "Equipment created successfully",
-            "equipment": created_equipment.model_dump(mode="json")
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    created_equipment = await get_visionboard_handler().create_equipment(equipment)
+    _equipment_cache.pop(created_equipment.category, None)
+    return json_response(envelope("equipment", encode_json(created_equipment), "Equipment created successfully"))
 
 @router.get("/equipment/category/{category}")
 async def get_equipment_by_category(
@@ -350,14 +287,12 @@ async def get_equipment_by_category(
     token: Token = Depends(get_user_token)
 ):
     """Get equipment by category"""
-    try:
+    body = _equipment_cache.get(category)
+    if body is None:
         equipment = await get_visionboard_handler().get_equipment_by_category(category)
-        return JSONResponse({
-            "message": "success",
-            "equipment": [eq.model_dump(mode="json") for eq in equipment]
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        body = envelope("equipment", encode_json(equipment, _EQUIPMENT_ADAPTER))
+        _equipment_cache[category] = body
+    return json_response(body)
 
 # Genre Assignment Operations
 @router.post("/assignments")
@@ -367,75 +302,44 @@ async def create_genre_assignment(
     token: Token = Depends(get_user_token)
 ):
     """Create a new genre assignment (invite someone to a role)"""
-    try:
-        created_assignment = await get_visionboard_handler().create_genre_assignment(
-            assignment=assignment, 
-            assigned_by=token.sub
-        )
-        return JSONResponse({
-            "message": "Assignment created successfully",
-            "assignment": created_assignment.model_dump(mode="json")
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    created_assignment = await get_visionboard_handler().create_genre_assignment(
+        assignment=assignment, 
+        assigned_by=token.sub
+    )
+    _genre_assignments_cache.pop(created_assignment.genre_id, None)
+    return json_response(envelope("assignment", encode_json(created_assignment), "Assignment created successfully"))
 
-@router.put("/assignments/{assignment_id}/status")
+@router.put("/assignments/{assignment_id:uuid}/status")
 async def update_assignment_status(
     request: Request, 
-    assignment_id: str, 
-    status: str, 
+    assignment_id: uuid.UUID, 
+    assignment_status: AssignmentStatus = Depends(status_query(_ASSIGNMENT_STATUSES, required=True)), 
     token: Token = Depends(get_user_token)
 ):
     """Update assignment status (accept/reject invitation)"""
-    try:
-        try:
-            assignment_status = AssignmentStatus(status)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid status")
-        
-        assignment = await get_visionboard_handler().update_assignment_status(
-            assignment_id=uuid.UUID(assignment_id), 
-            status=assignment_status, 
-            user_id=token.sub
-        )
-        if not assignment:
-            raise HTTPException(status_code=404, detail="Assignment not found")
-        
-        return JSONResponse({
-            "message": "Assignment status updated successfully",
-            "assignment": assignment.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid assignment ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    assignment = await get_visionboard_handler().update_assignment_status(
+        assignment_id=assignment_id, 
+        status=assignment_status, 
+        user_id=token.sub
+    )
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    _genre_assignments_cache.pop(assignment.genre_id, None)
+    return json_response(envelope("assignment", encode_json(assignment), "Assignment status updated successfully"))
 
 @router.get("/user/assignments")
 async def get_user_assignments(
     request: Request, 
-    status: str = None,
+    assignment_status: Optional[AssignmentStatus] = Depends(status_query(_ASSIGNMENT_STATUSES)),
     token: Token = Depends(get_user_token)
 ):
     """Get all assignments for the current user"""
-    try:
-        assignment_status = None
-        if status:
-            try:
-                assignment_status = AssignmentStatus(status)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid status")
-        
-        assignments = await get_visionboard_handler().get_user_assignments(
-            user_id=token.sub, 
-            status=assignment_status
-        )
+    assignments = await get_visionboard_handler().get_user_assignments(
+        user_id=token.sub, 
+        status=assignment_status
+    )
         
-        return JSONResponse({
-            "message": "success",
-            "assignments": [assignment.model_dump(mode="json") for assignment in assignments]
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("assignments", encode_json(assignments, _ASSIGNMENTS_ADAPTER)))
 
 # Task Operations
 @router.post("/tasks")
@@ -445,91 +349,56 @@ async def create_task(
     token: Token = Depends(get_user_token)
 ):
     """Create a new task"""
-    try:
-        created_task = await get_visionboard_handler().create_task(
-            task=task, 
-            created_by=token.sub
-        )
-        return JSONResponse({
-            "message": "Task created successfully",
-            "task": created_task.model_dump(mode="json")
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    created_task = await get_visionboard_handler().create_task(
+        task=task, 
+        created_by=token.sub
+    )
+    return json_response(envelope("task", encode_json(created_task), "Task created successfully"))
 
-@router.put("/tasks/{task_id}/status")
+@router.put("/tasks/{task_id:uuid}/status")
 async def update_task_status(
     request: Request, 
-    task_id: str, 
-    status: str, 
+    task_id: uuid.UUID, 
+    task_status: TaskStatus = Depends(status_query(_TASK_STATUSES, required=True)), 
     token: Token = Depends(get_user_token)
 ):
     """Update task status"""
-    try:
-        try:
-            task_status = TaskStatus(status)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid status")
-        
-        task = await get_visionboard_handler().update_task_status(
-            task_id=uuid.UUID(task_id), 
-            status=task_status, 
-            user_id=token.sub
-        )
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
+    task = await get_visionboard_handler().update_task_status(
+        task_id=task_id, 
+        status=task_status, 
+        user_id=token.sub
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
         
-        return JSONResponse({
-            "message": "Task status updated successfully",
-            "task": task.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid task ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("task", encode_json(task), "Task status updated successfully"))
 
-@router.get("/tasks/{task_id}/with-details")
+@router.get("/tasks/{task_id:uuid}/with-details")
 async def get_task_with_details(
     request: Request, 
-    task_id: str, 
+    task_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get a task with all its details (comments, attachments, dependencies)"""
-    try:
-        task = await get_visionboard_handler().get_task_with_details(uuid.UUID(task_id))
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
+    task = await get_visionboard_handler().get_task_with_details(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
         
-        return JSONResponse({
-            "message": "success",
-            "task": task.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid task ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("task", encode_json(task)))
 
 # Analytics and Statistics
-@router.get("/{visionboard_id}/summary")
+@router.get("/{visionboard_id:uuid}/summary")
 async def get_visionboard_summary(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get comprehensive summary of a vision board"""
-    try:
-        summary = await get_visionboard_handler().get_visionboard_summary(uuid.UUID(visionboard_id))
-        if not summary:
-            raise HTTPException(status_code=404, detail="Vision board not found")
+    summary = await get_visionboard_handler().get_visionboard_summary(visionboard_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Vision board not found")
         
-        return JSONResponse({
-            "message": "success",
-            "summary": summary.model_dump(mode="json")
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_response(envelope("summary", encode_json(summary)))
 
 @router.get("/user/stats")
 async def get_user_stats(
@@ -537,73 +406,47 @@ async def get_user_stats(
     token: Token = Depends(get_user_token)
 ):
     """Get comprehensive stats for the current user"""
-    try:
-        stats = await get_visionboard_handler().get_user_stats(token.sub)
-        return JSONResponse({
-            "message": "success",
-            "stats": stats.model_dump(mode="json")
-        })
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    stats = await get_visionboard_handler().get_user_stats(token.sub)
+    return json_response(envelope("stats", encode_json(stats)))
 
 # Complex Queries (as specified in requirements)
-@router.get("/{visionboard_id}/assignments")
+@router.get("/{visionboard_id:uuid}/assignments")
 async def get_visionboard_assignments(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get all people assigned to a vision board"""
-    try:
-        assignments = await get_visionboard_handler().get_visionboard_assignments(uuid.UUID(visionboard_id))
-        return JSONResponse({
-            "message": "success",
-            "assignments": to_serializable(assignments)
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    assignments = await get_visionboard_handler().get_visionboard_assignments(visionboard_id)
+    return json_response(envelope("assignments", encode_json(assignments)))
 
-@router.get("/{visionboard_id}/user/{user_id}/tasks")
+@router.get("/{visionboard_id:uuid}/user/{user_id:uuid}/tasks")
 async def get_user_tasks_in_visionboard(
     request: Request, 
-    visionboard_id: str, 
-    user_id: str, 
+    visionboard_id: uuid.UUID, 
+    user_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get all tasks for a specific person in a vision board"""
-    try:
-        tasks = await get_visionboard_handler().get_user_tasks_in_visionboard(
-            user_id=uuid.UUID(user_id), 
-            visionboard_id=uuid.UUID(visionboard_id)
-        )
-        return JSONResponse({
-            "message": "success",
-            "tasks": to_serializable(tasks)
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    tasks = await get_visionboard_handler().get_user_tasks_in_visionboard(
+        user_id=user_id, 
+        visionboard_id=visionboard_id
+    )
+    return json_response(envelope("tasks", encode_json(tasks)))
 
-@router.get("/{visionboard_id}/equipment-requirements")
+@router.get("/{visionboard_id:uuid}/equipment-requirements")
 async def get_visionboard_equipment_requirements(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get equipment requirements for a vision board"""
-    try:
-        equipment = await get_visionboard_handler().get_visionboard_equipment_requirements(uuid.UUID(visionboard_id))
-        return JSONResponse({
-            "message": "success",
-            "equipment_requirements": equipment
-        })
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    body = _equipment_requirements_cache.get(visionboard_id)
+    if body is None:
+        equipment = await get_visionboard_handler().get_visionboard_equipment_requirements(visionboard_id)
+        body = envelope("equipment_requirements", encode_json(equipment))
+        _equipment_requirements_cache[visionboard_id] = body
+    return json_response(body)
 
 @router.get("/notifications")
 async def get_notifications(token: Token = Depends(get_user_token)):
@@ -612,58 +455,33 @@ async def get_notifications(token: Token = Depends(get_user_token)):
     """
     handler = get_visionboard_handler()
     notifications = await handler.get_notifications_for_user(token.sub)
-    return {"notifications": [n.model_dump(mode="json") for n in notifications]}
+    return json_response(envelope("notifications", encode_json(notifications, _NOTIFICATIONS_ADAPTER), message=None))
 
-@router.get("/{visionboard_id}/users")
+@router.get("/{visionboard_id:uuid}/users")
 async def get_visionboard_users(
     request: Request, 
-    visionboard_id: str, 
+    visionboard_id: uuid.UUID, 
     token: Token = Depends(get_user_token)
 ):
     """Get all users involved in a vision board (creator + assigned users)"""
-    try:
-        print(f"DEBUG: Raw visionboard_id received: '{visionboard_id}'")
-        # Convert to lowercase to handle case sensitivity issues
-        visionboard_id_lower = visionboard_id.lower()
-        print(f"DEBUG: Lowercase visionboard_id: '{visionboard_id_lower}'")
-        users = await get_visionboard_handler().get_visionboard_users(uuid.UUID(visionboard_id_lower))
-        return JSONResponse({
-            "message": "success",
-            "users": [user.model_dump(mode="json") for user in users]
-        })
-    except ValueError as ve:
-        print(f"DEBUG: ValueError for visionboard_id: '{visionboard_id}' - {ve}")
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    except Exception as e:
-        print(f"DEBUG: Exception in get_visionboard_users: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    users = await get_visionboard_handler().get_visionboard_users(visionboard_id)
+    return json_response(envelope("users", encode_json(users, _USERS_ADAPTER)))
 
 @router.post("/notifications/batch-create")
 async def batch_create_notifications(request: Request, notifications: List[dict], token: Token = Depends(get_user_token)):
     """Batch create notifications for multiple events."""
-    handler = get_visionboard_handler()
-    created = []
-    for notif in notifications:
-        await handler.create_notification(
-            receiver_id=notif["receiver_id"],
-            sender_id=token.sub,
-            object_type=notif["object_type"],
-            object_id=notif["object_id"],
-            event_type=notif["event_type"],
-            data=notif.get("data"),
-            message=notif.get("message")
-        )
-        created.append(notif["receiver_id"])
-    return {"message": "Notifications created", "notified_users": created}
+    await get_visionboard_handler().create_notifications_bulk(notifications, sender_id=token.sub)
+    created = [notif["receiver_id"] for notif in notifications]
+    return ORJSONResponse({"message": "Notifications created", "notified_users": created})
 
-@router.post("/notifications/{notification_id}/respond")
-async def respond_to_notification(notification_id: uuid.UUID, response: str, comment: str = None, token: Token = Depends(get_user_token)):
+@router.post("/notifications/{notification_id:uuid}/respond")
+async def respond_to_notification(notification_id: uuid.UUID, response: InvitationStatus, comment: str = None, token: Token = Depends(get_user_token)):
     """Accept or reject an invitation and notify the sender."""
     handler = get_visionboard_handler()
-    notif = await handler.respond_to_notification(notification_id, responder_id=token.sub, response=response, comment=comment)
+    notif = await handler.respond_to_notification(notification_id, responder_id=token.sub, response=response.value, comment=comment)
     if notif is None:
         raise HTTPException(status_code=404, detail="Notification not found or not allowed")
-    return {"message": f"Invitation {response.lower()}.", "notification": notif.model_dump(mode="json")}
+    return json_response(envelope("notification", encode_json(notif), f"Invitation {response.value}."))
 
 # Invitation Endpoints
 @router.post("/invitations")
@@ -674,259 +492,200 @@ async def create_invitation(
 ):
     """Create a new invitation (generic)"""
     handler = get_visionboard_handler()
-    inv = await handler.create_invitation(sender_id=token.sub, invitation=invitation)
-    # Optionally, send a notification here
-    await handler.create_notification(
-        receiver_id=invitation.receiver_id,
-        sender_id=token.sub,
-        object_type=invitation.object_type,
-        object_id=invitation.object_id,
-        event_type="invited",
-        data=invitation.data,
-        message=f"You have been invited to a {invitation.object_type}."
-    )
-    return {"message": "Invitation created", "invitation": inv.model_dump(mode="json")}
+    inv = await handler.create_invitation_with_notification(sender_id=token.sub, invitation=invitation)
+    return json_response(envelope("invitation", encode_json(inv), "Invitation created"))
 
 @router.get("/invitations/user")
 async def get_user_invitations(
     request: Request,
-    status: str = None,
+    inv_status: Optional[InvitationStatus] = Depends(status_query(_INVITATION_STATUSES, "Invalid invitation status")),
     token: Token = Depends(get_user_token)
 ):
     """Get all invitations for the current user (optionally filter by status)"""
     handler = get_visionboard_handler()
-    inv_status = None
-    if status:
-        try:
-            inv_status = InvitationStatus(status)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid invitation status")
     invitations = await handler.get_invitations_for_user(token.sub, status=inv_status)
-    return {"invitations": [i.model_dump(mode="json") for i in invitations]}
+    return json_response(envelope("invitations", encode_json(invitations, _INVITATIONS_ADAPTER), message=None))
 
-@router.get("/invitations/object/{object_type}/{object_id}")
+@router.get("/invitations/object/{object_type}/{object_id:uuid}")
 async def get_object_invitations(
     request: Request,
     object_type: str,
-    object_id: str,
+    object_id: uuid.UUID,
     token: Token = Depends(get_user_token)
 ):
     """Get all invitations for a given object (e.g., visionboard, genre, etc.)"""
     handler = get_visionboard_handler()
-    try:
-        obj_uuid = uuid.UUID(object_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid object ID")
-    invitations = await handler.get_invitations_for_object(object_type, obj_uuid)
-    return {"invitations": [i.model_dump(mode="json") for i in invitations]}
+    invitations = await handler.get_invitations_for_object(object_type, object_id)
+    return json_response(envelope("invitations", encode_json(invitations, _INVITATIONS_ADAPTER), message=None))
 
-@router.post("/invitations/{invitation_id}/respond")
+@router.post("/invitations/{invitation_id:uuid}/respond")
 async def respond_to_invitation(
-    invitation_id: str,
-    response: str,
+    invitation_id: uuid.UUID,
+    response: InvitationStatus,
     data: dict = None,
     token: Token = Depends(get_user_token)
 ):
     """Accept or reject an invitation (only receiver can respond)"""
     handler = get_visionboard_handler()
-    try:
-        inv_uuid = uuid.UUID(invitation_id)
-        status = InvitationStatus(response)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid invitation ID or response")
-    inv = await handler.respond_to_invitation(inv_uuid, responder_id=token.sub, status=status, data=data)
+    inv = await handler.respond_to_invitation(invitation_id, responder_id=token.sub, status=response, data=data)
     if not inv:
         raise HTTPException(status_code=404, detail="Invitation not found or not allowed")
-    # Optionally, send a notification to the sender
-    await handler.create_notification(
-        receiver_id=inv.sender_id,
-        sender_id=token.sub,
-        object_type=inv.object_type,
-        object_id=inv.object_id,
-        event_type="invitation_response",
-        data={"response": response, "data": data},
-        message=f"User responded: {response} to your invitation."
-    )
-    return {"message": f"Invitation {response.lower()}.", "invitation": inv.model_dump(mode="json")}
+    if inv.object_type == "genre":
+        # The response may have moved the genre's assignment along with it
+        _genre_assignments_cache.pop(inv.object_id, None)
+    return json_response(envelope("invitation", encode_json(inv), f"Invitation {response.value}."))
 
-@router.post("/{visionboard_id}/group-chat/message")
+@router.post("/{visionboard_id:uuid}/group-chat/message")
 async def send_group_message(
-    visionboard_id: str,
+    visionboard_id: uuid.UUID,
     msg: GroupMessageCreate,
     token: Token = Depends(get_user_token)
 ):
     """Send group message with debug logging"""
-    logger.info(f"📤 Group message send attempt")
-    logger.debug(f"   Visionboard ID: {visionboard_id}")
-    logger.debug(f"   Sender (from token): {token.sub}")
-    logger.debug(f"   Message content: {msg.message[:50]}...")
+    logger.info("📤 Group message send attempt")
+    logger.debug("   Visionboard ID: %s", visionboard_id)
+    logger.debug("   Sender (from token): %s", token.sub)
+    logger.debug("   Message content: %s...", msg.message[:50])
     
     handler = get_visionboard_handler()
     try:
-        logger.info(f"✅ Sending group message to visionboard {visionboard_id}")
+        logger.info("✅ Sending group message to visionboard %s", visionboard_id)
         message = await handler.send_group_message(
-            visionboard_id=uuid.UUID(visionboard_id),
+            visionboard_id=visionboard_id,
             sender_id=token.sub,
             message=msg.message
         )
-        logger.info(f"✅ Group message sent successfully")
-        return {"message": "Message sent", "group_message": message.model_dump(mode="json")}
+        logger.info("✅ Group message sent successfully")
+        return json_response(envelope("group_message", encode_json(message), "Message sent"))
     except PermissionError as e:
-        logger.warning(f"🚫 Permission denied for group message: {str(e)}")
-        logger.warning(f"   User: {token.sub}")
-        logger.warning(f"   Visionboard: {visionboard_id}")
+        logger.warning("🚫 Permission denied for group message: %s", e)
+        logger.warning("   User: %s", token.sub)
+        logger.warning("   Visionboard: %s", visionboard_id)
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
-        logger.error(f"❌ Failed to send group message: {str(e)}")
+        logger.error("❌ Failed to send group message: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to send message: {str(e)}")
 
-@router.get("/{visionboard_id}/group-chat/messages")
+@router.get("/{visionboard_id:uuid}/group-chat/messages")
 async def get_group_messages(
-    visionboard_id: str,
+    visionboard_id: uuid.UUID,
     limit: int = 50,
     before: datetime.datetime = None,
     token: Token = Depends(get_user_token)
 ):
     """Get group messages with debug logging"""
-    logger.info(f"📥 Group message fetch attempt")
-    logger.debug(f"   Visionboard ID: {visionboard_id}")
-    logger.debug(f"   Requesting user (from token): {token.sub}")
-    logger.debug(f"   Limit: {limit}")
-    logger.debug(f"   Before: {before}")
+    logger.info("📥 Group message fetch attempt")
+    logger.debug("   Visionboard ID: %s", visionboard_id)
+    logger.debug("   Requesting user (from token): %s", token.sub)
+    logger.debug("   Limit: %s", limit)
+    logger.debug("   Before: %s", before)
     
     handler = get_visionboard_handler()
     try:
-        logger.info(f"✅ Fetching group messages for visionboard {visionboard_id}")
+        logger.info("✅ Fetching group messages for visionboard %s", visionboard_id)
         messages = await handler.get_group_messages(
-            visionboard_id=uuid.UUID(visionboard_id),
+            visionboard_id=visionboard_id,
             user_id=token.sub,
             limit=limit,
             before=before
         )
-        logger.info(f"✅ Retrieved {len(messages)} group messages")
-        
-        # Fetch avatar_url for each sender
-        from src.utils.user_handler import UserHandler
-        user_handler = UserHandler()
-        result = []
+        logger.info("✅ Retrieved %s group messages", len(messages))
         
-        logger.debug(f"👤 Fetching avatars for {len(messages)} group messages...")
-        for i, m in enumerate(messages):
-            sender_id = str(m.sender_id)
-            logger.debug(f"   Message {i+1}: sender_id = {sender_id}")
-            
-            try:
-                user = await user_handler.fetch_user(user_id=sender_id)
-                avatar_url = user.profile_image_url if user and hasattr(user, 'profile_image_url') else None
-                logger.debug(f"   ✅ Avatar for {sender_id}: {avatar_url}")
-            except Exception as e:
-                logger.error(f"   ❌ Failed to fetch avatar for {sender_id}: {str(e)}")
-                avatar_url = None
-            
-            msg_dict = m.model_dump(mode="json")
-            msg_dict["avatar_url"] = avatar_url
-            result.append(msg_dict)
+        # One pydantic-core pass for the whole page; ids come back as str
+        result = _GROUP_MESSAGES_ADAPTER.dump_python(messages, mode="json")
+        # Avatars of every distinct sender in one query
+        avatars = await _fetch_avatar_urls(list({msg["sender_id"] for msg in result}))
+        for msg in result:
+            msg["avatar_url"] = avatars.get(msg["sender_id"])
         
-        logger.info(f"✅ Returning {len(result)} group messages with avatars")
-        return {"messages": result}
+        logger.info("✅ Returning %s group messages with avatars", len(result))
+        return ORJSONResponse({"messages": result})
     except PermissionError as e:
-        logger.warning(f"🚫 Permission denied for group messages: {str(e)}")
-        logger.warning(f"   User: {token.sub}")
-        logger.warning(f"   Visionboard: {visionboard_id}")
+        logger.warning("🚫 Permission denied for group messages: %s", e)
+        logger.warning("   User: %s", token.sub)
+        logger.warning("   Visionboard: %s", visionboard_id)
         raise HTTPException(status_code=403, detail=str(e))
     except Exception as e:
-        logger.error(f"❌ Failed to fetch group messages: {str(e)}")
+        logger.error("❌ Failed to fetch group messages: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch messages: {str(e)}")
 
 # --- Draft Endpoints ---
-@router.get("/{visionboard_id}/drafts")
-async def list_drafts(visionboard_id: str, token: Token = Depends(get_user_token)):
-    drafts = await get_visionboard_handler().list_drafts(uuid.UUID(visionboard_id))
-    return [d.model_dump(mode="json") for d in drafts]
-
-@router.post("/{visionboard_id}/drafts")
-async def create_draft(visionboard_id: str, draft: DraftCreate, token: Token = Depends(get_user_token)):
-    logger = logging.getLogger("visionboard.draft")
-    logger.debug(f"Received create_draft request: visionboard_id={visionboard_id}, user_id={token.sub}, draft={draft}")
-    try:
-        created = await get_visionboard_handler().create_draft(
-            visionboard_id=uuid.UUID(visionboard_id),
-            user_id=token.sub,
-            media_url=draft.media_url,
-            media_type=draft.media_type,
-            description=draft.description
-        )
-        logger.debug(f"Draft created successfully: {created}")
-        return created.model_dump(mode="json")
-    except Exception as e:
-        logger.error(f"Error creating draft: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+@router.get("/{visionboard_id:uuid}/drafts")
+async def list_drafts(visionboard_id: uuid.UUID, token: Token = Depends(get_user_token)):
+    drafts = await get_visionboard_handler().list_drafts(visionboard_id)
+    return json_response(encode_json(drafts, _DRAFTS_ADAPTER))
+
+@router.post("/{visionboard_id:uuid}/drafts")
+async def create_draft(visionboard_id: uuid.UUID, draft: DraftCreate, token: Token = Depends(get_user_token)):
+    draft_logger.debug("Received create_draft request: visionboard_id=%s, user_id=%s, draft=%s", visionboard_id, token.sub, draft)
+    created = await get_visionboard_handler().create_draft(
+        visionboard_id=visionboard_id,
+        user_id=token.sub,
+        media_url=draft.media_url,
+        media_type=draft.media_type,
+        description=draft.description
+    )
+    draft_logger.debug("Draft created successfully: %s", created)
+    return json_response(encode_json(created))
 
-@router.get("/drafts/{draft_id}")
-async def get_draft(draft_id: str, token: Token = Depends(get_user_token)):
-    draft = await get_visionboard_handler().get_draft(uuid.UUID(draft_id))
+@router.get("/drafts/{draft_id:uuid}")
+async def get_draft(draft_id: uuid.UUID, token: Token = Depends(get_user_token)):
+    draft = await get_visionboard_handler().get_draft(draft_id)
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
-    return draft.model_dump(mode="json")
+    return json_response(encode_json(draft))
 
-@router.patch("/drafts/{draft_id}")
-async def update_draft(draft_id: str, update: DraftUpdate, token: Token = Depends(get_user_token)):
+@router.patch("/drafts/{draft_id:uuid}")
+async def update_draft(draft_id: uuid.UUID, update: DraftUpdate, token: Token = Depends(get_user_token)):
     fields = {k: v for k, v in update.model_dump(exclude_unset=True).items()}
-    updated = await get_visionboard_handler().update_draft(uuid.UUID(draft_id), token.sub, **fields)
+    updated = await get_visionboard_handler().update_draft(draft_id, token.sub, **fields)
     if not updated:
         raise HTTPException(status_code=404, detail="Draft not found or not allowed")
-    return updated.model_dump(mode="json")
+    return json_response(encode_json(updated))
 
-@router.delete("/drafts/{draft_id}")
-async def delete_draft(draft_id: str, token: Token = Depends(get_user_token)):
-    success = await get_visionboard_handler().delete_draft(uuid.UUID(draft_id), token.sub)
+@router.delete("/drafts/{draft_id:uuid}")
+async def delete_draft(draft_id: uuid.UUID, token: Token = Depends(get_user_token)):
+    success = await get_visionboard_handler().delete_draft(draft_id, token.sub)
     if not success:
         raise HTTPException(status_code=404, detail="Draft not found or not allowed")
-    return {"message": "Draft deleted"}
+    return ORJSONResponse({"message": "Draft deleted"})
 
 # --- Draft Comment Endpoints ---
-@router.get("/drafts/{draft_id}/comments")
-async def list_draft_comments(draft_id: str, token: Token = Depends(get_user_token)):
-    comments = await get_visionboard_handler().list_draft_comments(uuid.UUID(draft_id))
-    return [c.model_dump(mode="json") for c in comments]
+@router.get("/drafts/{draft_id:uuid}/comments")
+async def list_draft_comments(draft_id: uuid.UUID, token: Token = Depends(get_user_token)):
+    comments = await get_visionboard_handler().list_draft_comments(draft_id)
+    return json_response(encode_json(comments, _DRAFT_COMMENTS_ADAPTER))
 
-@router.post("/drafts/{draft_id}/comments")
-async def create_draft_comment(draft_id: str, comment: DraftCommentCreate, token: Token = Depends(get_user_token)):
+@router.post("/drafts/{draft_id:uuid}/comments")
+async def create_draft_comment(draft_id: uuid.UUID, comment: DraftCommentCreate, token: Token = Depends(get_user_token)):
     created = await get_visionboard_handler().create_draft_comment(
-        draft_id=uuid.UUID(draft_id),
+        draft_id=draft_id,
         user_id=token.sub,
         comment=comment.comment
     )
-    return created.model_dump(mode="json")
+    return json_response(encode_json(created))
 
-@router.patch("/draft-comments/{comment_id}")
-async def update_draft_comment(comment_id: str, update: DraftCommentUpdate, token: Token = Depends(get_user_token)):
+@router.patch("/draft-comments/{comment_id:uuid}")
+async def update_draft_comment(comment_id: uuid.UUID, update: DraftCommentUpdate, token: Token = Depends(get_user_token)):
     updated = await get_visionboard_handler().update_draft_comment(
-        comment_id=uuid.UUID(comment_id),
+        comment_id=comment_id,
         user_id=token.sub,
         comment=update.comment
     )
     if not updated:
         raise HTTPException(status_code=404, detail="Comment not found or not allowed")
-    return updated.model_dump(mode="json")
+    return json_response(encode_json(updated))
 
-@router.delete("/draft-comments/{comment_id}")
-async def delete_draft_comment(comment_id: str, token: Token = Depends(get_user_token)):
-    success = await get_visionboard_handler().delete_draft_comment(uuid.UUID(comment_id), token.sub)
+@router.delete("/draft-comments/{comment_id:uuid}")
+async def delete_draft_comment(comment_id: uuid.UUID, token: Token = Depends(get_user_token)):
+    success = await get_visionboard_handler().delete_draft_comment(comment_id, token.sub)
     if not success:
         raise HTTPException(status_code=404, detail="Comment not found or not allowed")
-    return {"message": "Comment deleted"}
+    return ORJSONResponse({"message": "Comment deleted"})
 
-@router.get("/{visionboard_id}/collaborators")
-async def get_visionboard_collaborators(visionboard_id: str, token: Token = Depends(get_user_token)):
+@router.get("/{visionboard_id:uuid}/collaborators")
+async def get_visionboard_collaborators(visionboard_id: uuid.UUID, token: Token = Depends(get_user_token)):
     """Get all collaborators (user_id, role) for a vision board."""
     handler = get_visionboard_handler()
-    try:
-        uuid_vb = uuid.UUID(visionboard_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid vision board ID")
-    collaborators = await handler.get_visionboard_collaborators(uuid_vb)
-    return [{"user_id": str(user_id), "role": role} for user_id, role in collaborators]
-
-# Include the router in the main app
-app.include_router(router) 
\ No newline at end of file
+    collaborators = await handler.get_visionboard_collaborators(visionboard_id)
+    return ORJSONResponse([{"user_id": str(user_id), "role": role} for user_id, role in collaborators])
@@ -1,14 +1,11 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from fastapi.responses import JSONResponse
 from src.app import app, user_handler
-from src.utils import TokenHandler
 import uuid
 import json
 import logging
 from typing import Dict, List
 import asyncio
 import redis.asyncio as redis
-from src.utils.visionboard_handler import VisionBoardHandler
 from src.models.visionboard import GroupMessage, DirectMessage
 from src.models.user import User
 
@@ -26,24 +23,11 @@ active_direct_connections: Dict[str, List[WebSocket]] = {}
 REDIS_URL = "redis://localhost:6379"
 redis_client = None
 
-def get_jwt_secret():
-    """Get JWT secret safely, handling startup timing"""
-    try:
-        return app.state.jwt_secret
-    except AttributeError:
-        # Fallback during startup or testing
-        import os
-        return os.environ.get("JWT_SECRET", "fallback_secret")
-
-def get_token_handler():
-    return TokenHandler(get_jwt_secret())
-
 def get_user_id_from_token(token: str):
     """Extract user ID from JWT token with debug logging"""
     try:
         logger.debug(f"🔐 Attempting to decode token: {token[:20]}...")
-        handler = get_token_handler()
-        decoded = handler.decode_token(token)
+        decoded = app.state.token_handler.decode_token(token)
         user_id = str(decoded.sub)
         logger.debug(f"✅ Token decoded successfully. User ID: {user_id}")
         return user_id
@@ -119,10 +103,8 @@ async def get_avatar_url(user_id: str):
 
 # Helper to get the global visionboard_handler
 def get_visionboard_handler():
-    if not hasattr(app.state, 'pool'):
+    if app.state.visionboard_handler is None:
         raise RuntimeError('Postgres pool not initialized')
-    if not hasattr(app.state, 'visionboard_handler'):
-        app.state.visionboard_handler = VisionBoardHandler(app.state.pool)
     return app.state.visionboard_handler
 
 # Group Chat WebSocket
@@ -158,6 +140,8 @@ async def group_chat_ws(websocket: WebSocket, visionboard_id: str, token: str =
         
         # Get Redis client
         redis_client = await get_redis()
+        # Resolved once per connection, not once per message
+        visionboard_handler = get_visionboard_handler()
         
         # Main message loop
         logger.info(f"🔄 Starting message loop for user {user_id} in room {room}")
@@ -177,7 +161,6 @@ async def group_chat_ws(websocket: WebSocket, visionboard_id: str, token: str =
                 message_text = data_json.get("message")
                 if message_text:
                     try:
-                        visionboard_handler = get_visionboard_handler()
                         await visionboard_handler.send_group_message(visionboard_id=visionboard_id, sender_id=user_id, message=message_text)
                         logger.info(f"✅ Group message saved to database for {user_id} in visionboard {visionboard_id}")
                     except Exception as e:
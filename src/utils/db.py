@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Optional
+
+import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
+
+logger = logging.getLogger(__name__)
+
+# Explicit column lists, so a column added to these tables cannot change the
+# result type of a statement prepared before the ALTER
+USER_COLUMNS = (
+    "id, name, username, description, email, password, profile_image_url, age, "
+    "genres, payment_mode, work_mode, location, rating, city, country, distance"
+)
+SHOWCASE_COLUMNS_S = "s.id, s.owner_id, s.visionboard, s.description, s.media_link, s.media_type"
+POST_COLUMNS = (
+    "id, user_id, caption, is_collaborative, status, visibility, "
+    "shared_from_post_id, created_at, updated_at, deleted_at"
+)
+
+# Raised when a prepared statement's plan no longer matches the schema
+STALE_PLAN_ERRORS = (
+    asyncpg.exceptions.InvalidCachedStatementError,
+    asyncpg.exceptions.FeatureNotSupportedError,
+)
+
+# Statements prepared on every new pool connection.
+HOT_STATEMENTS = {
+    "fetch_user_by_id": f"SELECT {USER_COLUMNS} FROM users WHERE id = $1",
+    "fetch_user_by_email": f"SELECT {USER_COLUMNS} FROM users WHERE email = $1 AND password = $2",
+    "fetch_users_by_ids": f"SELECT {USER_COLUMNS} FROM users WHERE id = ANY($1::uuid[])",
+    "fetch_showcase_viewer_state": (
+        "SELECT s.id, "
+        "EXISTS (SELECT 1 FROM showcase_likes l WHERE l.showcase_id = s.id AND l.user_id = $1) AS is_liked, "
+        "EXISTS (SELECT 1 FROM showcase_bookmarks b WHERE b.showcase_id = s.id AND b.user_id = $1) AS is_bookmarked, "
+        "(SELECT COUNT(*) FROM comments c WHERE c.showcase_id = s.id) AS comment_count "
+        "FROM unnest($2::uuid[]) AS s(id)"
+    ),
+    "fetch_artist_showcases": (
+        f"SELECT {SHOWCASE_COLUMNS_S}, "
+        "EXISTS (SELECT 1 FROM showcase_likes l WHERE l.showcase_id = s.id AND l.user_id = $2) AS is_liked, "
+        "EXISTS (SELECT 1 FROM showcase_bookmarks b WHERE b.showcase_id = s.id AND b.user_id = $2) AS is_bookmarked, "
+        "(SELECT COUNT(*) FROM comments c WHERE c.showcase_id = s.id) AS comment_count "
+        "FROM showcases s WHERE s.owner_id = $1"
+    ),
+    "follow_user": (
+        "WITH target AS (SELECT EXISTS (SELECT 1 FROM users WHERE id = $2) AS found), "
+        "inserted AS ("
+        "INSERT INTO followers (user_id, following_id) "
+        "SELECT $1, $2 FROM target WHERE found "
+        "ON CONFLICT DO NOTHING RETURNING 1"
+        ") "
+        "SELECT (SELECT found FROM target) AS found, EXISTS (SELECT 1 FROM inserted) AS created"
+    ),
+    "unfollow_user": "DELETE FROM followers WHERE user_id = $1 AND following_id = $2",
+    "user_exists": "SELECT EXISTS (SELECT 1 FROM users WHERE id = $1)",
+    "fetch_post_by_id": f"SELECT {POST_COLUMNS} FROM posts WHERE id = $1 AND deleted_at IS NULL",
+    "fetch_feed_page": (
+        f"SELECT {POST_COLUMNS} FROM posts WHERE deleted_at IS NULL "
+        "ORDER BY created_at DESC LIMIT $1"
+    ),
+    "fetch_feed_page_before": (
+        f"SELECT {POST_COLUMNS} FROM posts WHERE deleted_at IS NULL AND created_at < $1 "
+        "ORDER BY created_at DESC LIMIT $2"
+    ),
+    "insert_post_like": (
+        "INSERT INTO post_likes (user_id, post_id, created_at) "
+        "VALUES ($1, $2, now()) ON CONFLICT DO NOTHING"
+    ),
+    "delete_post_like": "DELETE FROM post_likes WHERE user_id = $1 AND post_id = $2",
+    "insert_post_comment": (
+        "INSERT INTO post_comments (id, post_id, user_id, content, parent_comment_id, created_at) "
+        "VALUES ($1, $2, $3, $4, $5, now())"
+    ),
+}
+
+
+class Connection(asyncpg.Connection):
+    """
+    asyncpg connection that carries the statements prepared in
+    `prepare_hot_statements`, keyed by their HOT_STATEMENTS name. Left
+    empty when the statement cache is disabled (PgBouncer transaction mode).
+    """
+
+    prepared: Dict[str, PreparedStatement]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = {}
+
+
+class Pool(asyncpg.Pool):
+    """
+    asyncpg pool whose acquire() waits at most `acquire_timeout` seconds by
+    default, so requests fail fast when every connection is busy instead of
+    queueing behind them.
+    """
+
+    acquire_timeout: Optional[float] = None
+
+    def acquire(self, *, timeout: Optional[float] = None):
+        if timeout is None:
+            timeout = self.acquire_timeout
+        return super().acquire(timeout=timeout)
+
+
+def create_pool(dsn: str, *, acquire_timeout: Optional[float] = None, **kwargs) -> Pool:
+    """Same as asyncpg.create_pool, but builds a `Pool`. Await the result."""
+    kwargs.setdefault("connection_class", Connection)
+    kwargs.setdefault("record_class", asyncpg.Record)
+    pool = Pool(dsn, loop=None, **kwargs)
+    pool.acquire_timeout = acquire_timeout
+    return pool
+
+
+async def prepare_hot_statements(conn: Connection) -> None:
+    prepared = {}
+    for name, query in HOT_STATEMENTS.items():
+        try:
+            prepared[name] = await conn.prepare(query)
+        except asyncpg.PostgresError as e:
+            # Runs inside the pool's connection init, where raising would
+            # abort pool creation; the helpers fall back to plain queries
+            logger.warning("Skipping hot statement %s: %s", name, e)
+    conn.prepared = prepared
+
+
+async def _run_hot(conn: Connection, name: str, stmt_method: str, conn_method: str, *args):
+    stmt = conn.prepared.get(name)
+    if stmt is None:
+        return await getattr(conn, conn_method)(HOT_STATEMENTS[name], *args)
+    try:
+        return await getattr(stmt, stmt_method)(*args)
+    except STALE_PLAN_ERRORS:
+        # asyncpg only re-prepares its own statement cache after a schema
+        # change, so replace ours. No hot statement runs inside a transaction,
+        # where the error would already have aborted it.
+        stmt = conn.prepared[name] = await conn.prepare(HOT_STATEMENTS[name])
+        return await getattr(stmt, stmt_method)(*args)
+
+
+async def fetchrow_hot(conn: Connection, name: str, *args) -> Optional[asyncpg.Record]:
+    return await _run_hot(conn, name, "fetchrow", "fetchrow", *args)
+
+
+async def fetch_hot(conn: Connection, name: str, *args) -> List[asyncpg.Record]:
+    return await _run_hot(conn, name, "fetch", "fetch", *args)
+
+
+async def fetchval_hot(conn: Connection, name: str, *args):
+    return await _run_hot(conn, name, "fetchval", "fetchval", *args)
+
+
+async def execute_hot(conn: Connection, name: str, *args) -> None:
+    await _run_hot(conn, name, "fetch", "execute", *args)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from cachetools import TTLCache
+from geopy.adapters import AioHTTPAdapter
+from geopy.exc import GeopyError
+from geopy.extra.rate_limiter import AsyncRateLimiter
+from geopy.geocoders import Nominatim
+
+NOMINATIM_USER_AGENT = "creatist-app"
+NOMINATIM_LANGUAGE = "en"
+
+
+class Geocoder:
+    """
+    Async reverse geocoder backed by a single Nominatim client. Results are
+    cached for a day per ~11 m cell (coordinates rounded to 4 decimals), and
+    misses are spaced to Nominatim's one-request-per-second usage policy.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = NOMINATIM_USER_AGENT,
+        timeout: float = 2.0,
+        maxsize: int = 4096,
+        ttl: float = 24 * 60 * 60,
+        precision: int = 4,
+        min_delay_seconds: float = 1.0,
+    ):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.precision = precision
+        self.min_delay_seconds = min_delay_seconds
+
+        self._geolocator: Optional[Nominatim] = None
+        self._reverse: Optional[AsyncRateLimiter] = None
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Concurrent misses for the same cell share one lookup
+        self._inflight: Dict[Tuple[float, float], asyncio.Future] = {}
+
+    def _get_reverse(self) -> AsyncRateLimiter:
+        # The aiohttp session needs a running loop, so build on first use
+        if self._reverse is None:
+            self._geolocator = Nominatim(
+                user_agent=self.user_agent,
+                scheme="https",
+                adapter_factory=AioHTTPAdapter,
+                timeout=self.timeout,
+            )
+            self._reverse = AsyncRateLimiter(
+                self._geolocator.reverse,
+                min_delay_seconds=self.min_delay_seconds,
+                max_retries=0,
+                swallow_exceptions=False,
+            )
+        return self._reverse
+
+    async def reverse(self, latitude: float, longitude: float) -> Tuple[str, str]:
+        """
+        Returns (city, country) for the coordinates, or empty strings when the
+        lookup fails or times out.
+        """
+        key = (round(latitude, self.precision), round(longitude, self.precision))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._lookup(key))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    async def _lookup(self, key: Tuple[float, float]) -> Tuple[str, str]:
+        try:
+            loc = await asyncio.wait_for(
+                self._get_reverse()(key, language=NOMINATIM_LANGUAGE),
+                timeout=self.timeout,
+            )
+        except (asyncio.TimeoutError, GeopyError):
+            return "", ""
+
+        city, country = "", ""
+        if loc and loc.raw and "address" in loc.raw:
+            address = loc.raw["address"]
+            city = (
+                address.get("city")
+                or address.get("town")
+                or address.get("village")
+                or ""
+            )
+            country = address.get("country", "")
+
+        self._cache[key] = (city, country)
+        return city, country
+
+    async def close(self) -> None:
+        if self._geolocator is not None:
+            await self._geolocator.__aexit__(None, None, None)
+            self._geolocator = None
+            self._reverse = None
+
+
+geocoder = Geocoder()
@@ -1,23 +1,58 @@
 import uuid
+import time
 import datetime
 import logging
+from collections import defaultdict
 from typing import List, Optional
 import asyncpg
+from src.utils.db import execute_hot, fetch_hot, fetchrow_hot
 from src.models.post import (
     Post, PostCreate, PostUpdate, PostWithDetails, PostMedia, PostMediaCreate, PostTag, PostCollaborator, PostCollaboratorCreate, PostComment, PostCommentCreate, PostCommentUpdate
 )
 
 logger = logging.getLogger(__name__)
 
+# First pages of /posts/feed and /posts/trending are read far more often than
+# they change, so each worker keeps them for a few seconds
+FEED_CACHE_TTL = 5.0
+TRENDING_CACHE_TTL = 30.0
+PAGE_CACHE_MAXSIZE = 64
+
 class PostHandler:
+    # Shared across the per-request handler instances: key -> (expires_at, page)
+    _page_cache: dict = {}
+
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
 
+    @classmethod
+    def _cached_page(cls, key) -> Optional[dict]:
+        entry = cls._page_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, page = entry
+        if expires_at < time.monotonic():
+            cls._page_cache.pop(key, None)
+            return None
+        return page
+
+    @classmethod
+    def _store_page(cls, key, page: dict, ttl: float) -> None:
+        if len(cls._page_cache) >= PAGE_CACHE_MAXSIZE:
+            cls._page_cache.clear()
+        cls._page_cache[key] = (time.monotonic() + ttl, page)
+
+    @classmethod
+    def invalidate_pages(cls, *kinds: str) -> None:
+        for key in [k for k in cls._page_cache if k[0] in kinds]:
+            cls._page_cache.pop(key, None)
+
     async def create_post(self, post: PostCreate, user_id: uuid.UUID) -> uuid.UUID:
         """Create a new post with comprehensive debug logging"""
         logger.info("🔧 PostHandler.create_post - Starting post creation")
-        logger.info(f"   User ID: {user_id}")
-        logger.info(f"   Post data: {post.model_dump()}")
+        logger.info("   User ID: %s", user_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   Post data: %s", post.model_dump_json())
         
         try:
             async with self.pool.acquire() as conn:
@@ -141,62 +176,54 @@ class PostHandler:
                         logger.debug("   No collaborators to insert")
                     
                     logger.info(f"   ✅ Post created successfully with ID: {post_id}")
-                    return post_id
+                self.invalidate_pages("feed")
+                return post_id
                     
-        except Exception as e:
-            logger.error(f"   ❌ Error in create_post: {str(e)}")
-            logger.error(f"   Error type: {type(e).__name__}")
-            logger.error(f"   Post data: {post.model_dump()}")
+        except Exception:
+            logger.exception("   ❌ Error in create_post; payload=%s", post.model_dump_json())
             raise
 
     async def get_feed(self, limit: int = 10, cursor: Optional[str] = None) -> dict:
+        if cursor is None:
+            cached = self._cached_page(("feed", limit))
+            if cached is not None:
+                return cached
         async with self.pool.acquire() as conn:
-            params = []
-            query = "SELECT * FROM posts WHERE deleted_at IS NULL"
             if cursor:
-                import datetime
                 if isinstance(cursor, str):
                     cursor = datetime.datetime.fromisoformat(cursor)
-                query += " AND created_at < $1"
-                params.append(cursor)
-            query += " ORDER BY created_at DESC LIMIT $%d" % (len(params) + 1)
-            params.append(limit + 1)
-            rows = await conn.fetch(query, *params)
-            posts = [await self._post_with_details(conn, row) for row in rows[:limit]]
+                rows = await fetch_hot(conn, "fetch_feed_page_before", cursor, limit + 1)
+            else:
+                rows = await fetch_hot(conn, "fetch_feed_page", limit + 1)
+            posts = await self._posts_with_details(conn, rows[:limit])
             next_cursor = None
             if len(rows) > limit:
                 next_cursor = str(rows[limit - 1]['created_at'].isoformat())
-            return {"posts": posts, "nextCursor": next_cursor}
+            page = {"posts": posts, "nextCursor": next_cursor}
+            if cursor is None:
+                self._store_page(("feed", limit), page, FEED_CACHE_TTL)
+            return page
 
     async def get_post_by_id(self, post_id: uuid.UUID) -> Optional[PostWithDetails]:
         async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM posts WHERE id = $1 AND deleted_at IS NULL", post_id)
+            row = await fetchrow_hot(conn, "fetch_post_by_id", post_id)
             if not row:
                 return None
             return await self._post_with_details(conn, row)
 
     async def like_post(self, post_id: uuid.UUID, user_id: uuid.UUID):
         async with self.pool.acquire() as conn:
-            await conn.execute(
-                "INSERT INTO post_likes (user_id, post_id, created_at) VALUES ($1, $2, now()) ON CONFLICT DO NOTHING",
-                user_id, post_id
-            )
+            await execute_hot(conn, "insert_post_like", user_id, post_id)
 
     async def unlike_post(self, post_id: uuid.UUID, user_id: uuid.UUID):
         async with self.pool.acquire() as conn:
-            await conn.execute(
-                "DELETE FROM post_likes WHERE user_id = $1 AND post_id = $2",
-                user_id, post_id
-            )
+            await execute_hot(conn, "delete_post_like", user_id, post_id)
 
     async def add_comment(self, post_id: uuid.UUID, user_id: uuid.UUID, comment: PostCommentCreate) -> PostComment:
         async with self.pool.acquire() as conn:
             comment_id = uuid.uuid4()
-            await conn.execute(
-                """
-                INSERT INTO post_comments (id, post_id, user_id, content, parent_comment_id, created_at)
-                VALUES ($1, $2, $3, $4, $5, now())
-                """,
+            await execute_hot(
+                conn, "insert_post_comment",
                 comment_id, post_id, user_id, comment.content, comment.parent_comment_id
             )
             return PostComment(
@@ -236,7 +263,7 @@ class PostHandler:
             query += " ORDER BY created_at DESC LIMIT $%d" % (len(params) + 1)
             params.append(limit)
             rows = await conn.fetch(query, *params)
-            return [await self._post_with_details(conn, row) for row in rows]
+            return await self._posts_with_details(conn, rows)
 
     async def search_posts(self, q: str, tag: Optional[str] = None, limit: int = 10, cursor: Optional[str] = None) -> List[PostWithDetails]:
         async with self.pool.acquire() as conn:
@@ -251,9 +278,13 @@ class PostHandler:
             query += " ORDER BY created_at DESC LIMIT $%d" % (len(params) + 1)
             params.append(limit)
             rows = await conn.fetch(query, *params)
-            return [await self._post_with_details(conn, row) for row in rows]
+            return await self._posts_with_details(conn, rows)
 
     async def get_trending_posts(self, limit: int = 10, cursor: Optional[str] = None) -> dict:
+        if cursor is None:
+            cached = self._cached_page(("trending", limit))
+            if cached is not None:
+                return cached
         async with self.pool.acquire() as conn:
             query = """
                 SELECT p.* FROM posts p
@@ -275,11 +306,14 @@ class PostHandler:
             query += " ORDER BY COALESCE(l.like_count,0) DESC, COALESCE(v.view_count,0) DESC, p.created_at DESC LIMIT $%d" % (len(params) + 1)
             params.append(limit + 1)
             rows = await conn.fetch(query, *params)
-            posts = [await self._post_with_details(conn, row) for row in rows[:limit]]
+            posts = await self._posts_with_details(conn, rows[:limit])
             next_cursor = None
             if len(rows) > limit:
                 next_cursor = str(rows[limit - 1]['created_at'].isoformat())
-            return {"posts": posts, "nextCursor": next_cursor}
+            page = {"posts": posts, "nextCursor": next_cursor}
+            if cursor is None:
+                self._store_page(("trending", limit), page, TRENDING_CACHE_TTL)
+            return page
 
     async def soft_delete_post(self, post_id: uuid.UUID, user_id: uuid.UUID):
         async with self.pool.acquire() as conn:
@@ -287,40 +321,75 @@ class PostHandler:
                 "UPDATE posts SET deleted_at = now() WHERE id = $1 AND user_id = $2",
                 post_id, user_id
             )
+        # A deleted post must not linger on either cached first page
+        self.invalidate_pages("feed", "trending")
 
     async def _post_with_details(self, conn, row) -> PostWithDetails:
-        post_id = row['id']
+        return (await self._posts_with_details(conn, [row]))[0]
+
+    async def _posts_with_details(self, conn, rows) -> List[PostWithDetails]:
+        """Load the details for a page of posts with one query per relation."""
+        if not rows:
+            return []
+        post_ids = [row['id'] for row in rows]
+        author_ids = list({row['user_id'] for row in rows})
+
         # Media
-        media_rows = await conn.fetch("SELECT * FROM post_media WHERE post_id = $1 ORDER BY \"order\" ASC", post_id)
-        media = [PostMedia(**dict(m)) for m in media_rows]
+        media = defaultdict(list)
+        for m in await conn.fetch(
+            "SELECT * FROM post_media WHERE post_id = ANY($1::uuid[]) ORDER BY \"order\" ASC", post_ids
+        ):
+            media[m['post_id']].append(PostMedia(**dict(m)))
         # Tags
-        tag_rows = await conn.fetch("SELECT tag FROM post_tags WHERE post_id = $1", post_id)
-        tags = [r['tag'] for r in tag_rows]
+        tags = defaultdict(list)
+        for r in await conn.fetch("SELECT post_id, tag FROM post_tags WHERE post_id = ANY($1::uuid[])", post_ids):
+            tags[r['post_id']].append(r['tag'])
         # Collaborators
-        collab_rows = await conn.fetch("SELECT post_id, user_id, role FROM post_collaborators WHERE post_id = $1", post_id)
-        collaborators = [PostCollaborator(**dict(c)) for c in collab_rows]
-        # Like count
-        like_count = await conn.fetchval("SELECT COUNT(*) FROM post_likes WHERE post_id = $1", post_id) or 0
-        # Comment count
-        comment_count = await conn.fetchval("SELECT COUNT(*) FROM post_comments WHERE post_id = $1 AND deleted_at IS NULL", post_id) or 0
-        # View count
-        view_count = await conn.fetchval("SELECT COUNT(*) FROM post_views WHERE post_id = $1", post_id) or 0
-        # Author name (optional, join users)
-        author_name = await conn.fetchval("SELECT name FROM users WHERE id = $1", row['user_id'])
-        # Top comments (first 3 root comments)
-        top_comment_rows = await conn.fetch(
-            "SELECT * FROM post_comments WHERE post_id = $1 AND parent_comment_id IS NULL AND deleted_at IS NULL ORDER BY created_at ASC LIMIT 3",
-            post_id
-        )
-        top_comments = [PostComment(**dict(tc)) for tc in top_comment_rows]
-        return PostWithDetails(
-            **dict(row),
-            media=media,
-            tags=tags,
-            collaborators=collaborators,
-            like_count=like_count,
-            comment_count=comment_count,
-            view_count=view_count,
-            author_name=author_name,
-            top_comments=top_comments
-        ) 
\ No newline at end of file
+        collaborators = defaultdict(list)
+        for c in await conn.fetch(
+            "SELECT post_id, user_id, role FROM post_collaborators WHERE post_id = ANY($1::uuid[])", post_ids
+        ):
+            collaborators[c['post_id']].append(PostCollaborator(**dict(c)))
+        # Like, comment and view counts
+        like_counts = dict(await conn.fetch(
+            "SELECT post_id, COUNT(*) FROM post_likes WHERE post_id = ANY($1::uuid[]) GROUP BY post_id", post_ids
+        ))
+        comment_counts = dict(await conn.fetch(
+            "SELECT post_id, COUNT(*) FROM post_comments WHERE post_id = ANY($1::uuid[]) AND deleted_at IS NULL GROUP BY post_id",
+            post_ids
+        ))
+        view_counts = dict(await conn.fetch(
+            "SELECT post_id, COUNT(*) FROM post_views WHERE post_id = ANY($1::uuid[]) GROUP BY post_id", post_ids
+        ))
+        # Author names
+        author_names = dict(await conn.fetch("SELECT id, name FROM users WHERE id = ANY($1::uuid[])", author_ids))
+        # Top comments (first 3 root comments per post)
+        top_comments = defaultdict(list)
+        for tc in await conn.fetch(
+            """
+            SELECT * FROM (
+                SELECT c.*, ROW_NUMBER() OVER (PARTITION BY c.post_id ORDER BY c.created_at ASC) AS rn
+                FROM post_comments c
+                WHERE c.post_id = ANY($1::uuid[]) AND c.parent_comment_id IS NULL AND c.deleted_at IS NULL
+            ) ranked
+            WHERE rn <= 3
+            ORDER BY created_at ASC
+            """,
+            post_ids
+        ):
+            top_comments[tc['post_id']].append(PostComment(**dict(tc)))
+
+        return [
+            PostWithDetails(
+                **dict(row),
+                media=media[row['id']],
+                tags=tags[row['id']],
+                collaborators=collaborators[row['id']],
+                like_count=like_counts.get(row['id'], 0),
+                comment_count=comment_counts.get(row['id'], 0),
+                view_count=view_counts.get(row['id'], 0),
+                author_name=author_names.get(row['user_id']),
+                top_comments=top_comments[row['id']]
+            )
+            for row in rows
+        ]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import decimal
+from functools import lru_cache
+from typing import Any, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+def orjson_default(obj):
+    # orjson encodes dict/list/datetime/UUID natively and only calls this for
+    # the rest, which for raw asyncpg rows means NUMERIC columns
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError
+
+
+def encode_json(content: Any, adapter: Optional[TypeAdapter] = None) -> bytes:
+    """
+    Encodes a response body once. Models and adapter-typed values go through
+    pydantic-core, which skips FastAPI's revalidation pass; anything else is
+    taken to be raw asyncpg row data and goes through orjson.
+    """
+    if adapter is not None:
+        return adapter.dump_json(content)
+    if isinstance(content, BaseModel):
+        return to_json(content)
+    # OPT_UTC_Z keeps timestamps in the same "Z" form pydantic emits
+    return orjson.dumps(content, default=orjson_default, option=orjson.OPT_UTC_Z)
+
+
+@lru_cache(maxsize=256)
+def _envelope_prefix(key: str, message: Optional[str]) -> bytes:
+    head = {} if message is None else {"message": message}
+    head[key] = None
+    # '{"message":"success","key":null}' -> '{"message":"success","key":'
+    return orjson.dumps(head)[:-len(b"null}")]
+
+
+def envelope(key: str, body: bytes, message: Optional[str] = "success") -> bytes:
+    """
+    Wraps an already-encoded JSON value as `{"message": message, key: body}`,
+    or `{key: body}` when message is None.
+    """
+    return _envelope_prefix(key, message) + body + b"}"
+
+
+def json_response(body: bytes) -> Response:
+    return Response(body, media_type="application/json")
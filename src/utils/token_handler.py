@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional, Tuple
 from uuid import UUID
 
 import jwt
+from jwt.utils import base64url_encode
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 from pytz import timezone
 import time
@@ -16,19 +19,26 @@ if TYPE_CHECKING:
     pass
 
 
-class Token(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Token:
     sub: UUID
     email: str
     name: str
-    iat: int = Field(
+    exp: int
+    iat: int = field(
         default_factory=lambda: int(datetime.now(timezone("UTC")).timestamp())
     )
-    exp: int
 
-    class Config:
-        json_encoders = {
-            UUID: lambda v: str(v),
-        }
+    @classmethod
+    def from_payload(cls, payload: dict) -> Token:
+        # The payload was just verified by jwt.decode, so skip validation
+        return cls(
+            sub=UUID(payload["sub"]),
+            email=payload["email"],
+            name=payload["name"],
+            exp=payload["exp"],
+            iat=payload["iat"],
+        )
 
 
 class RefreshToken(BaseModel):
@@ -39,18 +49,34 @@ class RefreshToken(BaseModel):
     )
     exp: int
 
-    class Config:
-        json_encoders = {
-            UUID: lambda v: str(v),
-        }
-
 
 class TokenHandler:
-    def __init__(self, secret: str, algorithm: str = "HS256"):
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str = "HS256",
+        cache_size: int = 10_000,
+        cache_ttl: float = 60,
+        rejected_ttl: float = 5,
+    ):
         self.secret = secret
         self.algorithm = algorithm
+        # Verification key prepared once. Given the raw secret, jwt.decode
+        # re-encodes it and re-runs its PEM/SSH key checks on every call.
+        self._verify_key = jwt.PyJWK(
+            {"kty": "oct", "k": base64url_encode(secret.encode()).decode()},
+            algorithm=algorithm,
+        )
         # In production, use Redis or database for revoked tokens
         self.revoked_tokens: set = set()
+        # Raw access token -> verified Token; a JWT string never changes, so
+        # only its expiry needs rechecking on a hit. The TTL lets idle
+        # sessions age out instead of waiting for LRU pressure.
+        self._decoded: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Raw token -> (error type, message) of a failed decode, so a bad token
+        # seen by both the middleware and a dependency, or replayed by a
+        # client, is not re-verified and re-logged with a traceback each time
+        self._rejected: TTLCache = TTLCache(maxsize=cache_size, ttl=rejected_ttl)
 
     def create_token_pair(self, user: User) -> Tuple[str, str]:
         """Create both access and refresh tokens"""
@@ -98,7 +124,7 @@ class TokenHandler:
     def refresh_access_token(self, refresh_token: str) -> Optional[str]:
         """Use refresh token to get new access token"""
         try:
-            decoded = jwt.decode(refresh_token, self.secret, algorithms=[self.algorithm])
+            decoded = jwt.decode(refresh_token, self._verify_key, algorithms=[self.algorithm])
             refresh_payload = RefreshToken(**decoded)
             
             # Check if token is revoked
@@ -126,7 +152,7 @@ class TokenHandler:
     def revoke_refresh_token(self, refresh_token: str) -> bool:
         """Revoke a refresh token"""
         try:
-            decoded = jwt.decode(refresh_token, self.secret, algorithms=[self.algorithm])
+            decoded = jwt.decode(refresh_token, self._verify_key, algorithms=[self.algorithm])
             self.revoked_tokens.add(refresh_token)
             log.info("Refresh token revoked for user: %s", decoded.get('sub'))
             return True
@@ -137,9 +163,9 @@ class TokenHandler:
     def validate_token(self, token: str) -> Optional[Token]:
         log.debug("Validating token")
         try:
-            decoded = jwt.decode(token, self.secret, algorithms=[self.algorithm])
+            decoded = jwt.decode(token, self._verify_key, algorithms=[self.algorithm])
             log.info("Token successfully validated")
-            return Token(**decoded)
+            return Token.from_payload(decoded)
         except jwt.ExpiredSignatureError:
             log.warning("Token has expired")
             return None
@@ -148,17 +174,32 @@ class TokenHandler:
             return None
 
     def decode_token(self, token: str) -> Optional[Token]:
+        cached = self._decoded.get(token)
+        if cached is not None:
+            if cached.exp > time.time():
+                return cached
+            self._decoded.pop(token, None)
+        rejected = self._rejected.get(token)
+        if rejected is not None:
+            error_type, message = rejected
+            raise error_type(message)
+        return self._verify_and_parse(token)
+
+    def _verify_and_parse(self, token: str) -> Token:
         log.debug("Decoding token")
         try:
-            decoded = jwt.decode(token, self.secret, algorithms=[self.algorithm])
+            decoded = jwt.decode(token, self._verify_key, algorithms=[self.algorithm])
             log.info("Token successfully decoded")
-            return Token(**decoded)
-        except jwt.InvalidTokenError:
+            parsed = Token.from_payload(decoded)
+        except jwt.InvalidTokenError as e:
             log.error("Token decoding failed due to invalid token", exc_info=True)
+            self._rejected[token] = (type(e), str(e))
             raise
+        self._decoded[token] = parsed
+        return parsed
 
     def decode_refresh_token(self, token: str) -> dict:
-        payload = jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        payload = jwt.decode(token, self._verify_key, algorithms=[self.algorithm])
         if payload.get("type") != "refresh":
             raise Exception("Not a refresh token")
         return payload
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import os
-from typing import Optional, Union, List
+import asyncio
+from typing import Dict, Optional, Union, List
 from uuid import UUID
 import math
 import enum
 
+import asyncpg
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from src.models.user import (
     User, UserUpdate, Showcase, Comment, VisionBoard,
@@ -13,13 +17,32 @@ from src.models.user import (
     VisionBoardTask, Follower, Location
 )
 from supabase import AsyncClient, create_async_client
+from src.utils.db import execute_hot, fetch_hot, fetchrow_hot, fetchval_hot
+from src.utils.log import log
 from fastapi import HTTPException
 
 load_dotenv()
 
+# Genre membership changes rarely; browse pages can lag by this many seconds
+GENRE_USERS_TTL = 30
+EARTH_RADIUS_KM = 6371
+SHOWCASE_COMPUTED_FIELDS = {"is_liked", "is_bookmarked", "comment_count"}
+
+
+def _haversine_km(lat1: float, lon1: float, cos_phi1: float, lat2: float, lon2: float) -> float:
+    # cos(phi1) is passed in since it is the same for every candidate
+    dphi = math.radians(lat2 - lat1)
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + cos_phi1 * math.cos(math.radians(lat2)) * math.sin(dlambda / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
 
 class UserHandler:
     supabase: AsyncClient
+    pool: Optional[asyncpg.Pool] = None
+
+    _genre_users: TTLCache = TTLCache(maxsize=256, ttl=GENRE_USERS_TTL)
+    _genre_users_inflight: Dict[str, asyncio.Future] = {}
 
     async def init(self):
         self.supabase = await create_async_client(
@@ -40,6 +63,24 @@ class UserHandler:
         if email and password:
             return await self._fetch_user_by_email(email, password)
 
+    async def fetch_users_by_ids(self, ids: List[Union[UUID, str]]) -> Dict[str, User]:
+        """Fetches several users in one query, keyed by str(id)."""
+        if not ids:
+            return {}
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await fetch_hot(conn, "fetch_users_by_ids", ids)
+            users = [self._user_from_record(row) for row in rows]
+        else:
+            response = await (
+                self.supabase.table("users")
+                .select("*")
+                .in_("id", [str(i) for i in ids])
+                .execute()
+            )
+            users = [User(**user) for user in response.data]
+        return {str(user.id): user for user in users}
+
     async def create_user(self, *, user: User):
         payload = user.model_dump(mode="json", exclude={"is_following"})
         response = await self.supabase.table("users").insert(payload).execute()
@@ -140,20 +181,28 @@ class UserHandler:
         )
         return [User(**user) for user in users_response.data]
 
-    async def follow(self, following_id: Union[UUID, str], *, user_id: Union[UUID, str]):
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
-        if isinstance(following_id, str):
-            following_id = UUID(following_id)
+    async def follow(self, following_id: Union[UUID, str], *, user_id: Union[UUID, str]) -> bool:
+        """
+        Returns False when the follow already existed. Raises LookupError when
+        the target user does not exist.
+        """
+        if self.pool is not None:
+            # Existence check and insert in a single round-trip
+            async with self.pool.acquire() as conn:
+                row = await fetchrow_hot(conn, "follow_user", user_id, following_id)
+            if not row["found"]:
+                raise LookupError(f"User {following_id} does not exist")
+            return row["created"]
         data = Follower(user_id=user_id, following_id=following_id)
         payload = data.model_dump(mode="json")
         await self.supabase.table("followers").insert(payload).execute()
+        return True
 
     async def unfollow(self, following_id: Union[UUID, str], *, user_id: Union[UUID, str]):
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
-        if isinstance(following_id, str):
-            following_id = UUID(following_id)
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                await execute_hot(conn, "unfollow_user", user_id, following_id)
+            return
         await (
             self.supabase.table("followers")
             .delete()
@@ -163,14 +212,46 @@ class UserHandler:
         )
 
     # Message Methods
-    async def get_message_users(self, *, user_id: Union[UUID, str]) -> List[User]:
+    async def get_message_users(self, *, user_id: Union[UUID, str]) -> List[dict]:
+        """
+        Conversation partners of the user, most recent first, each with their
+        profile and the last message exchanged.
+        """
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT u.*, m.message AS last_message, m.created_at AS last_message_at
+                    FROM (
+                        SELECT DISTINCT ON (partner_id) partner_id, message, created_at
+                        FROM (
+                            SELECT CASE WHEN sender_id = $1 THEN receiver_id ELSE sender_id END AS partner_id,
+                                   message, created_at
+                            FROM messages
+                            WHERE sender_id = $1 OR receiver_id = $1
+                        ) t
+                        ORDER BY partner_id, created_at DESC
+                    ) m
+                    JOIN users u ON u.id = m.partner_id
+                    ORDER BY m.created_at DESC
+                    """,
+                    user_id,
+                )
+            return [
+                {
+                    **self._user_from_record(row).model_dump(mode="json"),
+                    "last_message": row["last_message"],
+                    "last_message_at": row["last_message_at"].isoformat(),
+                }
+                for row in rows
+            ]
         response = await (
             self.supabase.table("messages")
             .select("DISTINCT sender_id, receiver_id")
             .or_(f"sender_id.eq.{user_id},receiver_id.eq.{user_id}")
             .execute()
         )
-        return [User(**user) for user in response.data]
+        return [User(**user).model_dump(mode="json") for user in response.data]
 
     async def create_message(self, *, sender_id: Union[UUID, str], receiver_id: Union[UUID, str], message: str):
         payload = {
@@ -203,7 +284,7 @@ class UserHandler:
         return [Showcase(**showcase) for showcase in response.data]
 
     async def create_showcase(self, *, showcase: Showcase, user_id: Union[UUID, str]):
-        payload = showcase.model_dump(mode="json")
+        payload = showcase.model_dump(mode="json", exclude=SHOWCASE_COMPUTED_FIELDS)
         payload["owner_id"] = str(user_id)
         await self.supabase.table("showcases").insert(payload).execute()
 
@@ -217,7 +298,7 @@ class UserHandler:
         return self._parse(response.data, model=Showcase)
 
     async def update_showcase(self, *, showcase_id: Union[UUID, str], showcase: Showcase, user_id: Union[UUID, str]):
-        payload = showcase.model_dump(mode="json")
+        payload = showcase.model_dump(mode="json", exclude=SHOWCASE_COMPUTED_FIELDS)
         await (
             self.supabase.table("showcases")
             .update(payload)
@@ -235,11 +316,37 @@ class UserHandler:
             .execute()
         )
 
+    async def attach_showcase_viewer_state(
+        self, showcases: List[Showcase], *, user_id: Union[UUID, str]
+    ) -> List[Showcase]:
+        """
+        Sets is_liked, is_bookmarked and comment_count on every showcase with
+        one query for the whole list.
+        """
+        if not showcases or self.pool is None:
+            return showcases
+        async with self.pool.acquire() as conn:
+            rows = await fetch_hot(
+                conn, "fetch_showcase_viewer_state", user_id, [s.id for s in showcases]
+            )
+        state = {row["id"]: row for row in rows}
+        for showcase in showcases:
+            row = state[showcase.id]
+            showcase.is_liked = row["is_liked"]
+            showcase.is_bookmarked = row["is_bookmarked"]
+            showcase.comment_count = row["comment_count"]
+        return showcases
+
     # Showcase Interaction Methods
     async def like_showcase(self, *, showcase_id: Union[UUID, str], user_id: Union[UUID, str]):
         data = ShowCaseLike(user_id=user_id, showcase_id=showcase_id)
         payload = data.model_dump(mode="json")
-        await self.supabase.table("showcase_likes").insert(payload).execute()
+        # INSERT ... ON CONFLICT DO NOTHING: repeat taps are a no-op, not an error
+        await (
+            self.supabase.table("showcase_likes")
+            .upsert(payload, ignore_duplicates=True, on_conflict="user_id,showcase_id")
+            .execute()
+        )
 
     async def unlike_showcase(self, *, showcase_id: Union[UUID, str], user_id: Union[UUID, str]):
         await (
@@ -259,7 +366,12 @@ class UserHandler:
     async def upvote_comment(self, *, comment_id: Union[UUID, str], user_id: Union[UUID, str]):
         data = CommentUpvote(user_id=user_id, comment_id=comment_id)
         payload = data.model_dump(mode="json")
-        await self.supabase.table("comment_upvotes").insert(payload).execute()
+        # INSERT ... ON CONFLICT DO NOTHING: repeat taps are a no-op, not an error
+        await (
+            self.supabase.table("comment_upvotes")
+            .upsert(payload, ignore_duplicates=True, on_conflict="user_id,comment_id")
+            .execute()
+        )
 
     async def remove_comment_upvote(self, *, comment_id: Union[UUID, str], user_id: Union[UUID, str]):
         await (
@@ -273,7 +385,12 @@ class UserHandler:
     async def bookmark_showcase(self, *, showcase_id: Union[UUID, str], user_id: Union[UUID, str]):
         data = ShowCaseBookmark(user_id=user_id, showcase_id=showcase_id)
         payload = data.model_dump(mode="json")
-        await self.supabase.table("showcase_bookmarks").insert(payload).execute()
+        # INSERT ... ON CONFLICT DO NOTHING: repeat taps are a no-op, not an error
+        await (
+            self.supabase.table("showcase_bookmarks")
+            .upsert(payload, ignore_duplicates=True, on_conflict="user_id,showcase_id")
+            .execute()
+        )
 
     async def unbookmark_showcase(self, *, showcase_id: Union[UUID, str], user_id: Union[UUID, str]):
         await (
@@ -335,55 +452,114 @@ class UserHandler:
         )
 
     # Browse Methods
-    async def get_nearby_artists(self, user_id: str, genre: str) -> list[User]:
-        # 1. Fetch the current user's location
-        current_user_resp = await self.supabase.table("users").select("*").eq("id", str(user_id)).single().execute()
-        current_user = current_user_resp.data
-        if not current_user or not current_user.get("location"):
-            return []
-
-        lat1 = current_user["location"]["latitude"]
-        lon1 = current_user["location"]["longitude"]
-
-        # 2. Fetch all users in the same genre (excluding the current user)
-        response = await self.supabase.table("users") \
-            .select("*") \
-            .neq("id", str(user_id)) \
-            .contains("genres", f'["{genre}"]') \
-            .execute()
+    async def get_nearby_artists(self, user_id: Union[UUID, str], genre: str) -> list[User]:
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                # 1. Fetch the current user's location
+                current_user = self._user_from_record(
+                    await fetchrow_hot(conn, "fetch_user_by_id", user_id)
+                )
+                if not current_user or not current_user.location:
+                    return []
+
+                # 2. Fetch all users in the same genre (excluding the current user),
+                #    flagging the ones the current user already follows
+                rows = await conn.fetch(
+                    """
+                    SELECT u.*, (f.user_id IS NOT NULL) AS is_following
+                    FROM users u
+                    LEFT JOIN followers f ON f.following_id = u.id AND f.user_id = $1
+                    WHERE u.id <> $1 AND u.genres @> jsonb_build_array($2::text)
+                    """,
+                    user_id,
+                    genre,
+                )
+            candidates = [self._user_from_record(row) for row in rows]
+        else:
+            current_user = await self._fetch_user_by_id(str(user_id))
+            if not current_user or not current_user.location:
+                return []
+            response = await (
+                self.supabase.table("users")
+                .select("*")
+                .neq("id", str(user_id))
+                .contains("genres", f'["{genre}"]')
+                .execute()
+            )
+            candidates = [User(**user) for user in response.data]
+            await self._mark_following(user_id, candidates)
 
-        def haversine(lat1, lon1, lat2, lon2):
-            R = 6371  # Earth radius in km
-            phi1 = math.radians(lat1)
-            phi2 = math.radians(lat2)
-            dphi = math.radians(lat2 - lat1)
-            dlambda = math.radians(lon2 - lon1)
-            a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
-            c = 2*math.atan2(math.sqrt(a), math.sqrt(1 - a))
-            return R * c
+        lat1 = current_user.location.latitude
+        lon1 = current_user.location.longitude
+        cos_phi1 = math.cos(math.radians(lat1))
 
         # 3. Calculate distance for each user and sort
         users = []
-        for user in response.data:
-            loc = user.get("location")
-            if loc and "latitude" in loc and "longitude" in loc:
-                distance = haversine(lat1, lon1, loc["latitude"], loc["longitude"])
-                user["distance"] = distance
+        for user in candidates:
+            if user.location:
+                user.distance = _haversine_km(
+                    lat1, lon1, cos_phi1, user.location.latitude, user.location.longitude
+                )
                 users.append(user)
 
-        users.sort(key=lambda u: u["distance"])
-        return [User(**user) for user in users]
-
-    async def get_top_rated_artists(self, genre_name: str) -> list[User]:
-        # Query users whose genres include the given genre_name, and order by rating descending
-        response = await self.supabase.table("users") \
-            .select("*") \
-            .contains("genres", f'["{genre_name}"]') \
-            .order("rating", desc=True) \
+        users.sort(key=lambda u: u.distance)
+        return users
+
+    async def get_top_rated_artists(
+        self, genre_name: str, current_user_id: Union[UUID, str]
+    ) -> list[User]:
+        # Users whose genres include genre_name, best rated first, flagged with
+        # whether the current user follows them
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT u.*, (f.user_id IS NOT NULL) AS is_following
+                    FROM users u
+                    LEFT JOIN followers f ON f.following_id = u.id AND f.user_id = $2
+                    WHERE u.genres @> jsonb_build_array($1::text)
+                    ORDER BY u.rating DESC
+                    """,
+                    genre_name,
+                    current_user_id,
+                )
+            return [self._user_from_record(row) for row in rows]
+        response = await (
+            self.supabase.table("users")
+            .select("*")
+            .contains("genres", f'["{genre_name}"]')
+            .order("rating", desc=True)
             .execute()
-        return [User(**user) for user in response.data]
+        )
+        users = [User(**user) for user in response.data]
+        await self._mark_following(current_user_id, users)
+        return users
 
-    async def get_artist_showcases(self, *, artist_id: Union[UUID, str]) -> List[Showcase]:
+    async def _mark_following(self, user_id: Union[UUID, str], users: list[User]):
+        if not users:
+            return
+        response = await (
+            self.supabase.table("followers")
+            .select("following_id")
+            .eq("user_id", str(user_id))
+            .in_("following_id", [str(user.id) for user in users])
+            .execute()
+        )
+        follows = {record["following_id"] for record in response.data}
+        for user in users:
+            user.is_following = str(user.id) in follows
+
+    async def get_artist_showcases(
+        self, *, artist_id: Union[UUID, str], viewer_id: Union[UUID, str]
+    ) -> List[Showcase]:
+        """
+        Returns the artist's showcases with the viewer's like/bookmark state
+        and comment counts already set, in one round-trip when the pool is up.
+        """
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                rows = await fetch_hot(conn, "fetch_artist_showcases", artist_id, viewer_id)
+            return [Showcase(**dict(row)) for row in rows]
         response = await (
             self.supabase.table("showcases")
             .select("*")
@@ -396,6 +572,12 @@ class UserHandler:
     async def _fetch_user_by_email(
         self, email: str, password: str
     ) -> Optional[User]:
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                row = await fetchrow_hot(
+                    conn, "fetch_user_by_email", email, password
+                )
+            return self._user_from_record(row)
         response = await (
             self.supabase.table("users")
             .select("*")
@@ -403,17 +585,28 @@ class UserHandler:
             .eq("password", password)
             .execute()
         )
-        print(response)
         return self._parse(response.data)
 
     async def _fetch_user_by_id(self, user_id):
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                row = await fetchrow_hot(conn, "fetch_user_by_id", user_id)
+            return self._user_from_record(row)
         response = await (
             self.supabase.table("users").select("*").eq("id", user_id).execute()
         )
         return self._parse(response.data)
 
+    def _user_from_record(self, row) -> Optional[User]:
+        if row is None:
+            return None
+        user = dict(row)
+        # jsonb columns arrive as text from asyncpg
+        for key in ("location", "genres"):
+            if isinstance(user.get(key), str):
+                user[key] = orjson.loads(user[key])
+        return User(**user)
+
     def _parse(self, response: list, count: int = 1, model: type = User):
         if len(response) == 0:
             return None
@@ -421,6 +614,24 @@ class UserHandler:
         return model(**response[0])
 
     async def get_users_by_genre(self, genre_name: str) -> list[User]:
+        cached = self._genre_users.get(genre_name)
+        if cached is not None:
+            return cached
+
+        # Concurrent misses for the same genre share a single query
+        inflight = self._genre_users_inflight.get(genre_name)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._query_users_by_genre(genre_name))
+            self._genre_users_inflight[genre_name] = inflight
+            inflight.add_done_callback(
+                lambda _: self._genre_users_inflight.pop(genre_name, None)
+            )
+
+        users = await asyncio.shield(inflight)
+        self._genre_users[genre_name] = users
+        return users
+
+    async def _query_users_by_genre(self, genre_name: str) -> list[User]:
         response = await (
             self.supabase.table("users")
             .select("*")
@@ -431,6 +642,13 @@ class UserHandler:
 
     async def user_exists(self, user_id: str) -> bool:
         user_id = str(user_id).lower()
+        if self.pool is not None:
+            try:
+                user_uuid = UUID(user_id)
+            except ValueError:
+                return False
+            async with self.pool.acquire() as conn:
+                return await fetchval_hot(conn, "user_exists", user_uuid)
         try:
             result = await (
                 self.supabase.table("users")
@@ -440,21 +658,9 @@ class UserHandler:
             )
             return len(result.data) > 0
         except Exception as e:
-            print(f"Error in user_exists: {str(e)}")
+            log.error("Error in user_exists: %s", e)
             return False
 
-    async def get_following_relationships(self, user_id: str, target_ids: List[str]) -> List[str]:
-        if not target_ids:
-            return []
-        response = await (
-            self.supabase.table("followers")
-            .select("following_id")
-            .eq("user_id", str(user_id))
-            .in_("following_id", target_ids)
-            .execute()
-        )
-        return [record["following_id"] for record in response.data]
-
     async def send_direct_message(self, sender_id: str, receiver_id: str, message: str):
         # Security: sender_id must match authenticated user
         payload = {
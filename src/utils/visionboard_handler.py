@@ -1,4 +1,7 @@
 from __future__ import annotations
+import asyncio
+import contextlib
+import logging
 import uuid
 import datetime
 from decimal import Decimal
@@ -19,25 +22,85 @@ from src.models.visionboard import (
     Invitation, InvitationCreate, InvitationUpdate, InvitationStatus,
     GroupMessage, Draft, DraftComment
 )
+from src.models.fields import json_text
 from src.models.user import User
 import json
 
+logger = logging.getLogger(__name__)
+
+# VisionBoard's fields, so serialized rows carry exactly what the model would
+VISIONBOARD_COLUMNS = "id, name, description, start_date, end_date, status, created_at, updated_at, created_by"
+VISIONBOARD_COLUMNS_VB = ", ".join(f"vb.{c}" for c in VISIONBOARD_COLUMNS.split(", "))
+
+INSERT_NOTIFICATION = """
+    INSERT INTO notifications (receiver_id, sender_id, object_type, object_id, event_type, status, data, message)
+    VALUES ($1, $2, $3, $4, $5, 'unread', $6, $7)
+"""
+NOTIFICATION_COLUMNS = ("receiver_id", "sender_id", "object_type", "object_id", "event_type", "status", "data", "message")
+# Batches this large are streamed with COPY instead of one INSERT per row
+NOTIFICATION_COPY_THRESHOLD = 100
+
+# Genre assignment status that follows each invitation response
+ASSIGNMENT_STATUS_FOR_RESPONSE = {
+    InvitationStatus.ACCEPTED: AssignmentStatus.ACCEPTED,
+    InvitationStatus.REJECTED: AssignmentStatus.REJECTED,
+}
+
 
 class VisionBoardHandler:
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
 
+    @contextlib.asynccontextmanager
+    async def _connection(self, conn: Optional[asyncpg.Connection] = None):
+        """
+        Yields `conn` when the caller already holds one, else acquires from
+        the pool, so nested helpers never hold a second connection.
+        """
+        if conn is not None:
+            yield conn
+        else:
+            async with self.pool.acquire() as conn:
+                yield conn
+
     # Vision Board CRUD Operations
-    async def create_notification(self, *, receiver_id, sender_id, object_type, object_id, event_type, data=None, message=None):
-        async with self.pool.acquire() as conn:
-            query = """
-                INSERT INTO notifications (receiver_id, sender_id, object_type, object_id, event_type, status, data, message)
-                VALUES ($1, $2, $3, $4, $5, 'unread', $6, $7)
-            """
-            # Serialize data if it's a dict
-            if isinstance(data, dict):
-                data = json.dumps(data)
-            await conn.execute(query, receiver_id, sender_id, object_type, object_id, event_type, data, message)
+    async def create_notification(self, *, receiver_id, sender_id, object_type, object_id, event_type, data=None, message=None, conn=None):
+        async with self._connection(conn) as conn:
+            await conn.execute(
+                INSERT_NOTIFICATION, receiver_id, sender_id, object_type, object_id, event_type, json_text(data), message
+            )
+
+    async def create_notifications_bulk(self, notifications: List[Dict[str, Any]], *, sender_id, conn=None) -> None:
+        """
+        Inserts one notification per dict (receiver_id, object_type, object_id,
+        event_type and optional data/message) from `sender_id`. executemany
+        pipelines every row in a single round-trip; large batches go through
+        COPY, which skips per-row statement execution altogether.
+        """
+        if not notifications:
+            return
+        if len(notifications) >= NOTIFICATION_COPY_THRESHOLD:
+            records = [
+                (
+                    n["receiver_id"], sender_id, n["object_type"], n["object_id"],
+                    n["event_type"], "unread", json_text(n.get("data")), n.get("message"),
+                )
+                for n in notifications
+            ]
+            async with self._connection(conn) as conn:
+                await conn.copy_records_to_table(
+                    "notifications", records=records, columns=NOTIFICATION_COLUMNS
+                )
+            return
+        rows = [
+            (
+                n["receiver_id"], sender_id, n["object_type"], n["object_id"],
+                n["event_type"], json_text(n.get("data")), n.get("message"),
+            )
+            for n in notifications
+        ]
+        async with self._connection(conn) as conn:
+            await conn.executemany(INSERT_NOTIFICATION, rows)
 
     async def create_visionboard(self, visionboard: VisionBoardCreate, created_by: uuid.UUID) -> VisionBoard:
         """Create a new vision board and send notification to the creator"""
@@ -66,14 +129,15 @@ class VisionBoardHandler:
                 object_id=vb.id,
                 event_type="created",
                 data=None,
-                message="Your vision board has been created."
+                message="Your vision board has been created.",
+                conn=conn,
             )
 
             return vb
 
-    async def get_visionboard(self, visionboard_id: uuid.UUID) -> Optional[VisionBoard]:
+    async def get_visionboard(self, visionboard_id: uuid.UUID, *, conn=None) -> Optional[VisionBoard]:
         """Get a vision board by ID"""
-        async with self.pool.acquire() as conn:
+        async with self._connection(conn) as conn:
             query = """
                 SELECT id, name, description, start_date, end_date, status, created_at, updated_at, created_by
                 FROM visionboards WHERE id = $1
@@ -83,27 +147,26 @@ class VisionBoardHandler:
 
     async def get_visionboard_with_genres(self, visionboard_id: uuid.UUID) -> Optional[VisionBoardWithGenres]:
         """Get a vision board with all its genres"""
-        async with self.pool.acquire() as conn:
-            # Get vision board
-            vb_query = """
-                SELECT id, name, description, start_date, end_date, status, created_at, updated_at, created_by
-                FROM visionboards WHERE id = $1
-            """
-            vb_row = await conn.fetchrow(vb_query, visionboard_id)
-            if not vb_row:
-                return None
+        vb_query = """
+            SELECT id, name, description, start_date, end_date, status, created_at, updated_at, created_by
+            FROM visionboards WHERE id = $1
+        """
+        genres_query = """
+            SELECT id, visionboard_id, name, description, min_required_people, max_allowed_people, created_at
+            FROM genres WHERE visionboard_id = $1
+        """
+        # Independent reads, each on its own pooled connection
+        vb_row, genres_rows = await asyncio.gather(
+            self.pool.fetchrow(vb_query, visionboard_id),
+            self.pool.fetch(genres_query, visionboard_id),
+        )
+        if not vb_row:
+            return None
 
-            # Get genres
-            genres_query = """
-                SELECT id, visionboard_id, name, description, min_required_people, max_allowed_people, created_at
-                FROM genres WHERE visionboard_id = $1
-            """
-            genres_rows = await conn.fetch(genres_query, visionboard_id)
-            
-            visionboard = VisionBoard(**dict(vb_row))
-            genres = [Genre(**dict(row)) for row in genres_rows]
-            
-            return VisionBoardWithGenres(**visionboard.model_dump(), genres=genres)
+        visionboard = VisionBoard(**dict(vb_row))
+        genres = [Genre(**dict(row)) for row in genres_rows]
+
+        return VisionBoardWithGenres(**visionboard.model_dump(), genres=genres)
 
     async def update_visionboard(self, visionboard_id: uuid.UUID, updates: VisionBoardUpdate) -> Optional[VisionBoard]:
         """Update a vision board. If status is set to 'Active' or 'Started', notify all partners."""
@@ -135,7 +198,7 @@ class VisionBoardHandler:
                 status_being_set = updates.status.value
                 param_count += 1
             if not set_clauses:
-                return await self.get_visionboard(visionboard_id)
+                return await self.get_visionboard(visionboard_id, conn=conn)
             set_clauses.append(f"updated_at = ${param_count}")
             values.append(datetime.datetime.utcnow())
             param_count += 1
@@ -158,17 +221,20 @@ class VisionBoardHandler:
                     WHERE g.visionboard_id = $1 AND ga.status = 'Accepted'
                 """
                 partner_rows = await conn.fetch(partners_query, visionboard_id)
-                partner_ids = [row['user_id'] for row in partner_rows]
-                for partner_id in partner_ids:
-                    await self.create_notification(
-                        receiver_id=partner_id,
-                        sender_id=vb.created_by,
-                        object_type="visionboard",
-                        object_id=vb.id,
-                        event_type="started",
-                        data=None,
-                        message="The vision board has been started."
-                    )
+                await self.create_notifications_bulk(
+                    [
+                        {
+                            "receiver_id": row['user_id'],
+                            "object_type": "visionboard",
+                            "object_id": vb.id,
+                            "event_type": "started",
+                            "message": "The vision board has been started.",
+                        }
+                        for row in partner_rows
+                    ],
+                    sender_id=vb.created_by,
+                    conn=conn,
+                )
 
             return vb
 
@@ -179,10 +245,13 @@ class VisionBoardHandler:
             result = await conn.execute(query, visionboard_id)
             return result == "DELETE 1"
 
-    async def get_user_visionboards(self, *, user_id: uuid.UUID, status: Optional[VisionBoardStatus] = None) -> List[VisionBoard]:
-        """Get all vision boards created by a user"""
+    async def get_user_visionboards(self, *, user_id: uuid.UUID, status: Optional[VisionBoardStatus] = None, serialize: bool = False) -> List[VisionBoard] | List[Dict[str, Any]]:
+        """
+        Get all vision boards created by a user. With `serialize`, returns the
+        rows as plain dicts for direct JSON encoding instead of VisionBoards.
+        """
         async with self.pool.acquire() as conn:
-            query = "SELECT * FROM visionboards WHERE created_by = $1"
+            query = f"SELECT {VISIONBOARD_COLUMNS} FROM visionboards WHERE created_by = $1"
             params = [user_id]
             
             if status:
@@ -192,13 +261,18 @@ class VisionBoardHandler:
             query += " ORDER BY created_at DESC"
             
             rows = await conn.fetch(query, *params)
+            if serialize:
+                return [dict(row) for row in rows]
             return [VisionBoard(**dict(row)) for row in rows]
 
-    async def get_user_assigned_visionboards(self, *, user_id: uuid.UUID, status: Optional[VisionBoardStatus] = None) -> List[VisionBoard]:
-        """Get all vision boards where a user is assigned/partner and assignment is accepted"""
+    async def get_user_assigned_visionboards(self, *, user_id: uuid.UUID, status: Optional[VisionBoardStatus] = None, serialize: bool = False) -> List[VisionBoard] | List[Dict[str, Any]]:
+        """
+        Get all vision boards where a user is assigned/partner and assignment
+        is accepted. `serialize` works as in get_user_visionboards.
+        """
         async with self.pool.acquire() as conn:
-            query = """
-                SELECT DISTINCT vb.* 
+            query = f"""
+                SELECT DISTINCT {VISIONBOARD_COLUMNS_VB}
                 FROM visionboards vb
                 JOIN genres g ON vb.id = g.visionboard_id
                 JOIN genre_assignments ga ON g.id = ga.genre_id
@@ -210,6 +284,8 @@ class VisionBoardHandler:
                 params.append(status.value)
             query += " ORDER BY vb.created_at DESC"
             rows = await conn.fetch(query, *params)
+            if serialize:
+                return [dict(row) for row in rows]
             return [VisionBoard(**dict(row)) for row in rows]
 
     # Genre Operations
@@ -260,10 +336,6 @@ class VisionBoardHandler:
     async def create_equipment(self, equipment: EquipmentCreate) -> Equipment:
         """Create new equipment"""
         async with self.pool.acquire() as conn:
-            # Serialize specifications as JSON string if it's a dict
-            specs = equipment.specifications
-            if isinstance(specs, dict):
-                specs = json.dumps(specs)
             query = """
                 INSERT INTO equipment (name, description, category, brand, model, specifications)
                 VALUES ($1, $2, $3, $4, $5, $6)
@@ -276,16 +348,9 @@ class VisionBoardHandler:
                 equipment.category,
                 equipment.brand,
                 equipment.model,
-                specs
+                json_text(equipment.specifications)
             )
-            # Parse specifications back to dict if it's a string
-            equipment_data = dict(row)
-            if isinstance(equipment_data.get('specifications'), str):
-                try:
-                    equipment_data['specifications'] = json.loads(equipment_data['specifications'])
-                except Exception:
-                    pass
-            return Equipment(**equipment_data)
+            return Equipment(**dict(row))
 
     async def get_equipment_by_category(self, category: str) -> List[Equipment]:
         """Get equipment by category"""
@@ -296,16 +361,7 @@ class VisionBoardHandler:
                 ORDER BY name
             """
             rows = await conn.fetch(query, category)
-            equipment_list = []
-            for row in rows:
-                equipment_data = dict(row)
-                if isinstance(equipment_data.get('specifications'), str):
-                    try:
-                        equipment_data['specifications'] = json.loads(equipment_data['specifications'])
-                    except Exception:
-                        pass
-                equipment_list.append(Equipment(**equipment_data))
-            return equipment_list
+            return [Equipment(**dict(row)) for row in rows]
 
     # Genre Assignment Operations
     async def create_genre_assignment(self, assignment: GenreAssignmentCreate, assigned_by: uuid.UUID) -> GenreAssignment:
@@ -343,22 +399,9 @@ class VisionBoardHandler:
                     "currency": assignment.currency
                 }
             )
-            await self.create_invitation(sender_id=assigned_by, invitation=invitation)
-
-            # Send notification to the user
-            await self.create_notification(
-                receiver_id=assignment.user_id,
-                sender_id=assigned_by,
-                object_type="genre",
-                object_id=assignment.genre_id,
-                event_type="invited",
-                data={
-                    "work_type": assignment.work_type.value,
-                    "payment_type": assignment.payment_type.value,
-                    "payment_amount": str(assignment.payment_amount) if assignment.payment_amount else None,
-                    "currency": assignment.currency
-                },
-                message=f"You have been invited to a genre."
+            # Invite and notify the user
+            await self.create_invitation_with_notification(
+                sender_id=assigned_by, invitation=invitation, conn=conn
             )
 
             return ga
@@ -471,62 +514,57 @@ class VisionBoardHandler:
 
     async def get_task_with_details(self, task_id: uuid.UUID) -> Optional[VisionBoardTaskWithDetails]:
         """Get a task with all its details (comments, attachments, dependencies)"""
-        async with self.pool.acquire() as conn:
-            # Get task
-            task_query = """
-                SELECT t.id, t.genre_assignment_id, t.title, t.description, t.priority, t.status, 
-                       t.due_date, t.estimated_hours, t.actual_hours, t.created_at, t.updated_at, t.created_by,
-                       u.name as user_name, g.name as genre_name
-                FROM tasks t
-                JOIN genre_assignments ga ON t.genre_assignment_id = ga.id
-                JOIN users u ON ga.user_id = u.id
-                JOIN genres g ON ga.genre_id = g.id
-                WHERE t.id = $1
-            """
-            task_row = await conn.fetchrow(task_query, task_id)
-            if not task_row:
-                return None
-
-            # Get comments
-            comments_query = """
-                SELECT id, task_id, user_id, comment, created_at, updated_at
-                FROM task_comments WHERE task_id = $1
-                ORDER BY created_at ASC
-            """
-            comments_rows = await conn.fetch(comments_query, task_id)
-
-            # Get attachments
-            attachments_query = """
-                SELECT id, task_id, file_name, file_url, file_type, file_size, uploaded_by, uploaded_at
-                FROM task_attachments WHERE task_id = $1
-                ORDER BY uploaded_at ASC
-            """
-            attachments_rows = await conn.fetch(attachments_query, task_id)
-
-            # Get dependencies
-            dependencies_query = """
-                SELECT id, task_id, depends_on_task_id, dependency_type
-                FROM task_dependencies WHERE task_id = $1
-            """
-            dependencies_rows = await conn.fetch(dependencies_query, task_id)
-
-            task_data = dict(task_row)
-            user_name = task_data.pop('user_name')
-            genre_name = task_data.pop('genre_name')
-
-            task = VisionBoardTask(**task_data)
-            comments = [TaskComment(**dict(row)) for row in comments_rows]
-            attachments = [TaskAttachment(**dict(row)) for row in attachments_rows]
-            dependencies = [TaskDependency(**dict(row)) for row in dependencies_rows]
-
-            return VisionBoardTaskWithDetails(
-                **task.model_dump(),
-                user_name=user_name,
-                genre_name=genre_name,
-                comments=comments,
-                attachments=attachments,
-                dependencies=dependencies
-            )
+        task_query = """
+            SELECT t.id, t.genre_assignment_id, t.title, t.description, t.priority, t.status, 
+                   t.due_date, t.estimated_hours, t.actual_hours, t.created_at, t.updated_at, t.created_by,
+                   u.name as user_name, g.name as genre_name
+            FROM tasks t
+            JOIN genre_assignments ga ON t.genre_assignment_id = ga.id
+            JOIN users u ON ga.user_id = u.id
+            JOIN genres g ON ga.genre_id = g.id
+            WHERE t.id = $1
+        """
+        comments_query = """
+            SELECT id, task_id, user_id, comment, created_at, updated_at
+            FROM task_comments WHERE task_id = $1
+            ORDER BY created_at ASC
+        """
+        attachments_query = """
+            SELECT id, task_id, file_name, file_url, file_type, file_size, uploaded_by, uploaded_at
+            FROM task_attachments WHERE task_id = $1
+            ORDER BY uploaded_at ASC
+        """
+        dependencies_query = """
+            SELECT id, task_id, depends_on_task_id, dependency_type
+            FROM task_dependencies WHERE task_id = $1
+        """
+        # Independent reads, each on its own pooled connection
+        task_row, comments_rows, attachments_rows, dependencies_rows = await asyncio.gather(
+            self.pool.fetchrow(task_query, task_id),
+            self.pool.fetch(comments_query, task_id),
+            self.pool.fetch(attachments_query, task_id),
+            self.pool.fetch(dependencies_query, task_id),
+        )
+        if not task_row:
+            return None
+
+        task_data = dict(task_row)
+        user_name = task_data.pop('user_name')
+        genre_name = task_data.pop('genre_name')
+
+        task = VisionBoardTask(**task_data)
+        comments = [TaskComment(**dict(row)) for row in comments_rows]
+        attachments = [TaskAttachment(**dict(row)) for row in attachments_rows]
+        dependencies = [TaskDependency(**dict(row)) for row in dependencies_rows]
+
+        return VisionBoardTaskWithDetails(
+            **task.model_dump(),
+            user_name=user_name,
+            genre_name=genre_name,
+            comments=comments,
+            attachments=attachments,
+            dependencies=dependencies
+        )
 
     # Statistics and Analytics
     async def get_visionboard_summary(self, visionboard_id: uuid.UUID) -> Optional[VisionBoardSummary]:
@@ -633,25 +671,24 @@ class VisionBoardHandler:
     async def get_visionboard_users(self, visionboard_id: uuid.UUID) -> List[User]:
         """Get all users involved in a vision board (creator + assigned users)"""
         async with self.pool.acquire() as conn:
-            # Get the vision board creator
-            creator_query = "SELECT created_by FROM visionboards WHERE id = $1"
-            creator_row = await conn.fetchrow(creator_query, visionboard_id)
-            if not creator_row:
-                return []
-            
-            creator_id = creator_row['created_by']
-            
-            # Get all assigned users
-            assigned_users_query = """
-                SELECT DISTINCT u.*
+            # Assigned users first, then the creator if not also assigned
+            query = """
+                WITH vb AS (SELECT created_by FROM visionboards WHERE id = $1),
+                assigned AS (
+                    SELECT ga.user_id
+                    FROM genre_assignments ga
+                    JOIN genres g ON ga.genre_id = g.id
+                    WHERE g.visionboard_id = $1
+                )
+                SELECT u.*
                 FROM users u
-                JOIN genre_assignments ga ON u.id = ga.user_id
-                JOIN genres g ON ga.genre_id = g.id
-                WHERE g.visionboard_id = $1
+                WHERE EXISTS (SELECT 1 FROM vb)
+                AND (u.id IN (SELECT user_id FROM assigned) OR u.id = (SELECT created_by FROM vb))
+                ORDER BY u.id NOT IN (SELECT user_id FROM assigned)
             """
-            assigned_rows = await conn.fetch(assigned_users_query, visionboard_id)
-            assigned_users = []
-            for row in assigned_rows:
+            rows = await conn.fetch(query, visionboard_id)
+            users = []
+            for row in rows:
                 row_dict = dict(row)
                 # Parse location field
                 if 'location' in row_dict and isinstance(row_dict['location'], str):
@@ -665,34 +702,8 @@ class VisionBoardHandler:
                         row_dict['genres'] = json.loads(row_dict['genres'])
                     except Exception:
                         row_dict['genres'] = None
-                assigned_users.append(User(**row_dict))
-            
-            # Get creator user details
-            creator_query = "SELECT * FROM users WHERE id = $1"
-            creator_row = await conn.fetchrow(creator_query, creator_id)
-            creator_user = None
-            if creator_row:
-                creator_dict = dict(creator_row)
-                # Parse location field
-                if 'location' in creator_dict and isinstance(creator_dict['location'], str):
-                    try:
-                        creator_dict['location'] = json.loads(creator_dict['location'])
-                    except Exception:
-                        creator_dict['location'] = None
-                # Parse genres field
-                if 'genres' in creator_dict and isinstance(creator_dict['genres'], str):
-                    try:
-                        creator_dict['genres'] = json.loads(creator_dict['genres'])
-                    except Exception:
-                        creator_dict['genres'] = None
-                creator_user = User(**creator_dict)
-            
-            # Combine creator and assigned users, removing duplicates
-            all_users = assigned_users
-            if creator_user and not any(user.id == creator_user.id for user in assigned_users):
-                all_users.append(creator_user)
-            
-            return all_users
+                users.append(User(**row_dict))
+            return users
 
     async def get_notifications_for_user(self, user_id: uuid.UUID):
         async with self.pool.acquire() as conn:
@@ -719,16 +730,17 @@ class VisionBoardHandler:
                 object_id=notif_row["object_id"],
                 event_type="response",
                 data={"response": response, "comment": comment},
-                message=f"User responded: {response}" + (f". Comment: {comment}" if comment else "")
+                message=f"User responded: {response}" + (f". Comment: {comment}" if comment else ""),
+                conn=conn,
             )
             from src.models.notification import Notification
             notif_row = await conn.fetchrow("SELECT * FROM notifications WHERE id = $1", notification_id)
             return Notification(**dict(notif_row)) 
 
     # Invitation Operations
-    async def create_invitation(self, sender_id: uuid.UUID, invitation: InvitationCreate) -> Invitation:
+    async def create_invitation(self, sender_id: uuid.UUID, invitation: InvitationCreate, *, conn=None) -> Invitation:
         """Create a new invitation"""
-        async with self.pool.acquire() as conn:
+        async with self._connection(conn) as conn:
             query = """
                 INSERT INTO invitations (receiver_id, sender_id, object_type, object_id, status, data)
                 VALUES ($1, $2, $3, $4, 'pending', $5)
@@ -740,15 +752,9 @@ class VisionBoardHandler:
                 sender_id,
                 invitation.object_type,
                 invitation.object_id,
-                json.dumps(invitation.data) if invitation.data else None
+                json_text(invitation.data)
             )
-            row_dict = dict(row)
-            if isinstance(row_dict.get('data'), str):
-                try:
-                    row_dict['data'] = json.loads(row_dict['data'])
-                except Exception:
-                    row_dict['data'] = None
-            return Invitation(**row_dict)
+            return Invitation(**dict(row))
 
     async def get_invitations_for_user(self, user_id: uuid.UUID, status: InvitationStatus | None = None) -> list[Invitation]:
         """Get all invitations for a user (optionally filter by status)"""
@@ -759,82 +765,82 @@ class VisionBoardHandler:
             else:
                 query = "SELECT * FROM invitations WHERE receiver_id = $1 ORDER BY created_at DESC"
                 rows = await conn.fetch(query, user_id)
-            invitations = []
-            for row in rows:
-                row_dict = dict(row)
-                if isinstance(row_dict.get('data'), str):
-                    try:
-                        row_dict['data'] = json.loads(row_dict['data'])
-                    except Exception:
-                        row_dict['data'] = None
-                invitations.append(Invitation(**row_dict))
-            return invitations
+            return [Invitation(**dict(row)) for row in rows]
 
     async def get_invitations_for_object(self, object_type: str, object_id: uuid.UUID) -> list[Invitation]:
         """Get all invitations for a given object (e.g., visionboard, genre, etc.)"""
         async with self.pool.acquire() as conn:
             query = "SELECT * FROM invitations WHERE object_type = $1 AND object_id = $2 ORDER BY created_at DESC"
             rows = await conn.fetch(query, object_type, object_id)
-            invitations = []
-            for row in rows:
-                row_dict = dict(row)
-                if isinstance(row_dict.get('data'), str):
-                    try:
-                        row_dict['data'] = json.loads(row_dict['data'])
-                    except Exception:
-                        row_dict['data'] = None
-                invitations.append(Invitation(**row_dict))
-            return invitations
+            return [Invitation(**dict(row)) for row in rows]
+
+    async def create_invitation_with_notification(self, sender_id: uuid.UUID, invitation: InvitationCreate, *, conn=None) -> Invitation:
+        """Create an invitation and notify its receiver in one statement"""
+        async with self._connection(conn) as conn:
+            query = """
+                WITH inv AS (
+                    INSERT INTO invitations (receiver_id, sender_id, object_type, object_id, status, data)
+                    VALUES ($1, $2, $3, $4, 'pending', $5)
+                    RETURNING id, receiver_id, sender_id, object_type, object_id, status, data, created_at, responded_at
+                ), notif AS (
+                    INSERT INTO notifications (receiver_id, sender_id, object_type, object_id, event_type, status, data, message)
+                    SELECT receiver_id, sender_id, object_type, object_id, 'invited', 'unread', data, $6 FROM inv
+                )
+                SELECT * FROM inv
+            """
+            row = await conn.fetchrow(
+                query,
+                invitation.receiver_id,
+                sender_id,
+                invitation.object_type,
+                invitation.object_id,
+                json_text(invitation.data),
+                f"You have been invited to a {invitation.object_type}."
+            )
+            return Invitation(**dict(row))
 
     async def respond_to_invitation(self, invitation_id: uuid.UUID, responder_id: uuid.UUID, status: InvitationStatus, data: dict | None = None) -> Invitation | None:
-        """Accept or reject an invitation (only receiver can respond)"""
+        """
+        Accept or reject an invitation (only receiver can respond). The same
+        statement notifies the sender and, for genre invitations, moves the
+        matching assignment to the status that follows the response.
+        """
+        assignment_status = ASSIGNMENT_STATUS_FOR_RESPONSE.get(status)
         async with self.pool.acquire() as conn:
             # Only allow receiver to respond
             query = """
-                UPDATE invitations
-                SET status = $1, responded_at = now(), data = $2
-                WHERE id = $3 AND receiver_id = $4
-                RETURNING id, receiver_id, sender_id, object_type, object_id, status, data, created_at, responded_at
+                WITH inv AS (
+                    UPDATE invitations
+                    SET status = $1, responded_at = now(), data = $2
+                    WHERE id = $3 AND receiver_id = $4
+                    RETURNING id, receiver_id, sender_id, object_type, object_id, status, data, created_at, responded_at
+                ), notif AS (
+                    INSERT INTO notifications (receiver_id, sender_id, object_type, object_id, event_type, status, data, message)
+                    SELECT sender_id, receiver_id, object_type, object_id, 'invitation_response', 'unread', $5, $6 FROM inv
+                ), assignment AS (
+                    UPDATE genre_assignments
+                    SET status = $7, responded_at = now()
+                    WHERE $7 IS NOT NULL
+                      AND genre_id = (SELECT object_id FROM inv WHERE object_type = 'genre')
+                      AND user_id = $4
+                )
+                SELECT * FROM inv
             """
             row = await conn.fetchrow(
                 query,
                 status.value,
-                json.dumps(data) if data else None,
+                json_text(data),
                 invitation_id,
-                responder_id
+                responder_id,
+                json_text({"response": status.value, "data": data}),
+                f"User responded: {status.value} to your invitation.",
+                assignment_status.value if assignment_status else None,
             )
             if not row:
-                print(f"DEBUG: Invitation not found or not allowed for id={invitation_id}, responder_id={responder_id}")
+                logger.debug("Invitation not found or not allowed for id=%s, responder_id=%s", invitation_id, responder_id)
                 return None
             row_dict = dict(row)
-            print(f"DEBUG: Invitation after update: {row_dict}")
-            if isinstance(row_dict.get('data'), str):
-                try:
-                    row_dict['data'] = json.loads(row_dict['data'])
-                except Exception:
-                    row_dict['data'] = None
-
-            # Update assignment status if this is a genre invitation
-            if row_dict.get('object_type') == 'genre':
-                assignment_status = None
-                if status == InvitationStatus.ACCEPTED:
-                    assignment_status = 'Accepted'
-                elif status == InvitationStatus.REJECTED:
-                    assignment_status = 'Rejected'
-                if assignment_status:
-                    print(f"DEBUG: Attempting to update assignment for genre_id={row_dict['object_id']} and user_id={row_dict['receiver_id']} to status={assignment_status}")
-                    result = await conn.execute(
-                        """
-                        UPDATE genre_assignments
-                        SET status = $1, responded_at = now()
-                        WHERE genre_id = $2 AND user_id = $3
-                        """,
-                        assignment_status,
-                        row_dict['object_id'],
-                        row_dict['receiver_id']
-                    )
-                    print(f"DEBUG: Assignment update result: {result}")
-
+            logger.debug("Invitation after update: %s", row_dict)
             return Invitation(**row_dict)
 
     async def send_group_message(self, visionboard_id: uuid.UUID, sender_id: uuid.UUID, message: str) -> 'GroupMessage':
@@ -3,9 +3,15 @@ from fastapi.testclient import TestClient
 from src.app import app
 import uuid
 from src.models.visionboard import GroupMessage
+from src.utils import TokenHandler
 
 client = TestClient(app)
 
+@pytest.fixture(autouse=True)
+def token_handler(monkeypatch):
+    # The app builds its handler in startup, which TestClient(app) skips
+    monkeypatch.setattr(app.state, "token_handler", TokenHandler("test_secret_key"))
+
 def test_root():
     response = client.get("/")
     assert response.status_code == 200
@@ -24,7 +30,7 @@ def test_direct_message_rest(monkeypatch):
     # Patch token handler to always return sender_id as sub
     class DummyToken:
         def __init__(self, sub):
-            self.sub = sub
+            self.sub = uuid.UUID(sub)
     def dummy_decode_token(token_str):
         return DummyToken(sender_id)
     monkeypatch.setattr("src.utils.token_handler.TokenHandler.decode_token", staticmethod(dummy_decode_token))
@@ -73,12 +79,12 @@ def test_fetch_direct_messages(monkeypatch):
         }]
     monkeypatch.setattr("src.utils.user_handler.UserHandler.get_direct_messages", async_get_direct_messages)
 
-    # Patch fetch_user to return a fake user with avatar
-    async def async_fetch_user(self, user_id):
+    # Patch fetch_users_by_ids to return a fake user with avatar
+    async def async_fetch_users_by_ids(self, ids):
         class DummyUser:
             profile_image_url = "https://example.com/avatar.png"
-        return DummyUser()
-    monkeypatch.setattr("src.utils.user_handler.UserHandler.fetch_user", async_fetch_user)
+        return {str(user_id): DummyUser() for user_id in ids}
+    monkeypatch.setattr("src.utils.user_handler.UserHandler.fetch_users_by_ids", async_fetch_users_by_ids)
 
     # Fetch direct messages
     response = client.get(f"/v1/message/{sender_id}", headers={"Authorization": f"Bearer {token}"})
@@ -93,9 +99,6 @@ def test_direct_chat_websocket(monkeypatch):
     from fastapi.testclient import TestClient
     from src.app import app
 
-    # Set up app state for testing
-    app.state.jwt_secret = "test_secret_key"
-    
     client = TestClient(app)
     sender_id = "1b8280ba-b64f-4590-a1d6-185c69cd4709"
     receiver_id = "67c74ef1-b519-42f4-9841-c71b318ac70a"
@@ -159,7 +162,6 @@ def test_group_chat_rest_send_message(monkeypatch):
     import uuid
 
     # Set up app state for testing
-    app.state.jwt_secret = "test_secret_key"
     app.state.pool = None  # Mock pool
 
     client = TestClient(app)
@@ -202,7 +204,6 @@ def test_group_chat_rest_fetch_messages(monkeypatch):
     import uuid
 
     # Set up app state for testing
-    app.state.jwt_secret = "test_secret_key"
     app.state.pool = None  # Mock pool
 
     client = TestClient(app)
@@ -231,12 +232,12 @@ def test_group_chat_rest_fetch_messages(monkeypatch):
         return DummyToken(sender_id)
     monkeypatch.setattr("src.utils.token_handler.TokenHandler.decode_token", staticmethod(dummy_decode_token))
 
-    # Patch fetch_user to return a fake user with avatar
-    async def async_fetch_user(self, user_id):
+    # Patch fetch_users_by_ids to return a fake user with avatar
+    async def async_fetch_users_by_ids(self, ids):
         class DummyUser:
             profile_image_url = "https://example.com/avatar.png"
-        return DummyUser()
-    monkeypatch.setattr("src.utils.user_handler.UserHandler.fetch_user", async_fetch_user)
+        return {str(user_id): DummyUser() for user_id in ids}
+    monkeypatch.setattr("src.utils.user_handler.UserHandler.fetch_users_by_ids", async_fetch_users_by_ids)
 
     # Fetch group messages
     response = client.get(f"/v1/visionboard/{visionboard_id}/group-chat/messages", headers={"Authorization": f"Bearer {token}"})
@@ -252,9 +253,6 @@ def test_group_chat_websocket(monkeypatch):
     from src.app import app
     import uuid
 
-    # Set up app state for testing
-    app.state.jwt_secret = "test_secret_key"
-    
     client = TestClient(app)
     sender_id = "1b8280ba-b64f-4590-a1d6-185c69cd4709"
     visionboard_id = str(uuid.uuid4())
@@ -309,4 +307,142 @@ def test_group_chat_websocket(monkeypatch):
     
     # Test basic app functionality
     response = client.get("/docs")
-    assert response.status_code == 200 
\ No newline at end of file
+    assert response.status_code == 200 
+
+def test_invitation_data_must_be_json_object(monkeypatch):
+    sender_id = "1b8280ba-b64f-4590-a1d6-185c69cd4709"
+    token = "testtoken"
+
+    class DummyToken:
+        def __init__(self, sub):
+            self.sub = uuid.UUID(sub)
+    def dummy_decode_token(token_str):
+        return DummyToken(sender_id)
+    monkeypatch.setattr("src.utils.token_handler.TokenHandler.decode_token", staticmethod(dummy_decode_token))
+
+    # A bare string is rejected at validation, before any database write
+    payload = {
+        "receiver_id": str(uuid.uuid4()),
+        "object_type": "visionboard",
+        "object_id": str(uuid.uuid4()),
+        "data": "hello",
+    }
+    response = client.post("/v1/visionboard/invitations", json=payload, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 422
+
+def test_showcase_like_is_deferred(monkeypatch):
+    user_id = "1b8280ba-b64f-4590-a1d6-185c69cd4709"
+    showcase_id = str(uuid.uuid4())
+
+    class DummyToken:
+        def __init__(self, sub):
+            self.sub = uuid.UUID(sub)
+    def dummy_decode_token(token_str):
+        return DummyToken(user_id)
+    monkeypatch.setattr("src.utils.token_handler.TokenHandler.decode_token", staticmethod(dummy_decode_token))
+
+    calls = []
+    async def async_like_showcase(self, *, showcase_id, user_id):
+        calls.append((showcase_id, user_id))
+    monkeypatch.setattr("src.utils.user_handler.UserHandler.like_showcase", async_like_showcase)
+
+    # The write runs after the 202 is sent; TestClient waits for it
+    response = client.put(f"/v1/showcase/{showcase_id}/like", headers={"Authorization": "Bearer testtoken"})
+    assert response.status_code == 202
+    assert response.content == b""
+    assert calls == [(uuid.UUID(showcase_id), uuid.UUID(user_id))]
+
+    from src.routes import user as user_routes
+    assert user_routes._pending_writes == {}
+
+def test_deferred_writes_collapse_to_latest():
+    import asyncio
+    from fastapi import BackgroundTasks
+    from src.routes import user as user_routes
+
+    calls = []
+    def write(name):
+        async def run():
+            calls.append(name)
+        return run
+
+    # A bookmark then an un-bookmark before the drain runs: only the last one is written
+    background = BackgroundTasks()
+    key = (uuid.uuid4(), uuid.uuid4(), "bookmark")
+    user_routes._enqueue_write(background, key, write("bookmark"))
+    user_routes._enqueue_write(background, key, write("unbookmark"))
+    assert len(background.tasks) == 1
+
+    asyncio.run(background())
+    assert calls == ["unbookmark"]
+    assert key not in user_routes._pending_writes
+
+def test_cancelled_deferred_write_releases_key():
+    import asyncio
+    from fastapi import BackgroundTasks
+    from src.routes import user as user_routes
+
+    key = (uuid.uuid4(), uuid.uuid4(), "like")
+
+    async def scenario():
+        started = asyncio.Event()
+        async def slow_write():
+            started.set()
+            await asyncio.sleep(60)
+        user_routes._enqueue_write(BackgroundTasks(), key, slow_write)
+        task = asyncio.ensure_future(user_routes._drain_write(key))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    # A later write for the same key gets scheduled again
+    assert key not in user_routes._pending_writes
+    background = BackgroundTasks()
+    async def noop():
+        pass
+    user_routes._enqueue_write(background, key, noop)
+    assert len(background.tasks) == 1
+    asyncio.run(background())
+
+def test_following_etag(monkeypatch):
+    user_id = "1b8280ba-b64f-4590-a1d6-185c69cd4709"
+
+    class DummyToken:
+        def __init__(self, sub):
+            self.sub = uuid.UUID(sub)
+    def dummy_decode_token(token_str):
+        return DummyToken(user_id)
+    monkeypatch.setattr("src.utils.token_handler.TokenHandler.decode_token", staticmethod(dummy_decode_token))
+
+    async def async_user_exists(self, user_id):
+        return True
+    monkeypatch.setattr("src.utils.user_handler.UserHandler.user_exists", async_user_exists)
+
+    following = []
+    async def async_get_following(self, *, user_id):
+        return list(following)
+    monkeypatch.setattr("src.utils.user_handler.UserHandler.get_following", async_get_following)
+
+    url = f"/v1/following/{user_id}"
+    headers = {"Authorization": "Bearer testtoken"}
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # Unchanged payload: empty 304, whether the tag is sent alone, in a list or as *
+    for if_none_match in (etag, f'"other", {etag}', etag.removeprefix("W/"), "*"):
+        response = client.get(url, headers={**headers, "If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    # Changed payload: full 200 with a new tag
+    from src.models.user import User
+    following.append(User(name="Artist", email="artist@example.com", password="x"))
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()["following"]) == 1